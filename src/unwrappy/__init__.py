@@ -16,7 +16,18 @@ from unwrappy.option import (
     traverse_options,
 )
 from unwrappy.result import Err, LazyResult, Ok, Result, is_err, is_ok, sequence_results, traverse_results
-from unwrappy.serde import ResultDecoder, ResultEncoder, dumps, loads, result_decoder
+from unwrappy.serde import (
+    ResultDecoder,
+    ResultEncoder,
+    dump,
+    dumps,
+    dumps_bytes,
+    dumps_fast,
+    load,
+    loads,
+    loads_fast,
+    result_decoder,
+)
 
 __version__ = version("unwrappy")
 
@@ -50,6 +61,11 @@ __all__ = [
     "result_decoder",
     "dumps",
     "loads",
+    "dump",
+    "load",
+    "dumps_fast",
+    "dumps_bytes",
+    "loads_fast",
     # Version
     "__version__",
 ]
@@ -32,7 +32,15 @@ class ChainedError:
         self.context = context
 
     def __str__(self) -> str:
-        return f"{self.context}: {self.error}"
+        # Walk the chain in a loop rather than recursing through nested __str__
+        # calls, so chains deeper than the recursion limit still format.
+        parts = [self.context]
+        error = self.error
+        while isinstance(error, ChainedError):
+            parts.append(error.context)
+            error = error.error
+        parts.append(str(error))
+        return ": ".join(parts)
 
     def __repr__(self) -> str:
         return f"ChainedError({self.error!r}, {self.context!r})"
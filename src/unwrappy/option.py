@@ -6,9 +6,9 @@ for safe handling of optional values without relying on Python's None.
 
 from __future__ import annotations
 
-import inspect
 from collections.abc import Awaitable, Callable, Coroutine, Iterable
 from dataclasses import dataclass
+from inspect import isawaitable
 from typing import TYPE_CHECKING, Any, Generic, Literal, NoReturn, TypeAlias, TypeVar, cast
 
 from unwrappy.exceptions import UnwrapError
@@ -37,6 +37,7 @@ class Some(Generic[T]):
         ```
     """
 
+    # `_value` is read directly by unwrappy.serde; keep the slot name stable.
     __slots__ = ("_value",)
     __match_args__ = ("_value",)
 
@@ -400,7 +401,7 @@ OptionOperation = (
 
 async def _maybe_await_option(value: U | Awaitable[U]) -> U:
     """Await if awaitable, otherwise return as-is."""
-    if inspect.isawaitable(value):
+    if isawaitable(value):
         return await value
     return cast(U, value)
 
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import inspect
 from collections.abc import Awaitable, Callable, Coroutine, Iterable
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Generic, Literal, NoReturn, TypeAlias, TypeVar, cast
+from functools import lru_cache
+from inspect import CO_COROUTINE, isawaitable
+from types import FunctionType, MethodType
+from typing import TYPE_CHECKING, Any, Generic, Literal, NoReturn, TypeAlias, TypeVar, cast, final
 
 from unwrappy.exceptions import ChainedError, UnwrapError
 
@@ -18,6 +19,7 @@ U = TypeVar("U")  # For transformations
 F = TypeVar("F")  # For error transformations
 
 
+@final
 class Ok(Generic[T]):
     """Success variant of Result containing a value.
 
@@ -32,6 +34,7 @@ class Ok(Generic[T]):
         ```
     """
 
+    # `_value` is read directly by unwrappy.serde; keep the slot name stable.
     __slots__ = ("_value",)
     __match_args__ = ("_value",)
 
@@ -42,7 +45,12 @@ class Ok(Generic[T]):
         return f"Ok({self._value!r})"
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, Ok) and self._value == other._value
+        if self is other:
+            return True
+        return type(other) is Ok and self._value == other._value
+
+    def __hash__(self) -> int:
+        return hash(("Ok", self._value))
 
     def is_ok(self) -> Literal[True]:
         """Return True (this is Ok)."""
@@ -171,17 +179,20 @@ class Ok(Generic[T]):
 
     def zip(self, other: Ok[U] | Err[F]) -> Ok[tuple[T, U]] | Err[F]:
         """Combine with another Result into a tuple."""
+        # Ok is final, so isinstance matches exactly what `type(other) is Ok` would,
+        # and ty can narrow `other` to Err[F] after it.
         if isinstance(other, Ok):
-            return Ok((self._value, other.unwrap()))
+            return Ok((self._value, other._value))
         return other
 
     def zip_with(self, other: Ok[U] | Err[F], fn: Callable[[T, U], Any]) -> Ok[Any] | Err[F]:
         """Combine with another Result using a function."""
-        if isinstance(other, Ok):
-            return Ok(fn(self._value, other.unwrap()))
+        if type(other) is Ok:
+            return Ok(fn(self._value, other._value))
         return other
 
 
+@final
 class Err(Generic[E]):
     """Error variant of Result containing an error value.
 
@@ -196,6 +207,7 @@ class Err(Generic[E]):
         ```
     """
 
+    # `_error` is read directly by unwrappy.serde; keep the slot name stable.
     __slots__ = ("_error",)
     __match_args__ = ("_error",)
 
@@ -206,7 +218,12 @@ class Err(Generic[E]):
         return f"Err({self._error!r})"
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, Err) and self._error == other._error
+        if self is other:
+            return True
+        return type(other) is Err and self._error == other._error
+
+    def __hash__(self) -> int:
+        return hash(("Err", self._error))
 
     def is_ok(self) -> Literal[False]:
         """Return False (this is not Ok)."""
@@ -344,65 +361,186 @@ Result: TypeAlias = Ok[T] | Err[E]
 """Type alias for the union of Ok and Err."""
 
 
-@dataclass(frozen=True, slots=True)
-class ResultMapOp:
-    """Operation that transforms the Ok value."""
-
-    fn: Callable[[Any], Any]
-
-
-@dataclass(frozen=True, slots=True)
-class ResultMapErrOp:
-    """Operation that transforms the Err value."""
-
-    fn: Callable[[Any], Any]
-
-
-@dataclass(frozen=True, slots=True)
-class ResultAndThenOp:
-    """Operation that chains a Result-returning function on Ok."""
-
-    fn: Callable[[Any], Any]
-
-
-@dataclass(frozen=True, slots=True)
-class ResultOrElseOp:
-    """Operation that chains a Result-returning function on Err."""
-
-    fn: Callable[[Any], Any]
-
-
-@dataclass(frozen=True, slots=True)
-class ResultTeeOp:
-    """Operation that executes a side effect on Ok."""
-
-    fn: Callable[[Any], Any]
-
-
-@dataclass(frozen=True, slots=True)
-class ResultInspectErrOp:
-    """Operation that executes a side effect on Err."""
+# LazyResult operations are stored as `(tag, fn)` pairs; flatten carries no fn.
+MAP = 0
+MAP_ERR = 1
+AND_THEN = 2
+OR_ELSE = 3
+TEE = 4
+INSPECT_ERR = 5
+FLATTEN = 6
+# Set on a tag at chain-build time when its fn is a coroutine function.
+ASYNC = 8
 
-    fn: Callable[[Any], Any]
+ResultOperation: TypeAlias = tuple[int, Callable[[Any], Any] | None]
+"""A LazyResult operation: an op tag and its callable."""
 
 
-@dataclass(frozen=True, slots=True)
-class ResultFlattenOp:
-    """Operation that flattens nested Result."""
+def _tag(tag: int, fn: Callable[..., Any]) -> int:
+    """Return `tag` with the ASYNC bit set if `fn` is a coroutine function.
 
-    pass
-
-
-ResultOperation = (
-    ResultMapOp | ResultMapErrOp | ResultAndThenOp | ResultOrElseOp | ResultTeeOp | ResultInspectErrOp | ResultFlattenOp
-)
-
-
-async def _maybe_await(value: U | Awaitable[U]) -> U:
-    """Await if awaitable, otherwise return as-is."""
-    if inspect.isawaitable(value):
-        return await value
-    return cast(U, value)
+    Only plain functions and methods bound from them are classified; any other
+    callable stays untagged and its result is checked with `isawaitable` when run.
+    """
+    if type(fn) in (FunctionType, MethodType):
+        # A MethodType can bind any callable, which need not have a __code__.
+        code = getattr(fn, "__code__", None)
+        if code is not None and code.co_flags & CO_COROUTINE:
+            return tag | ASYNC
+    return tag
+
+
+def _flattened(value: Any) -> Any:
+    """Return the Result held by an Ok being flattened; raise TypeError if it holds anything else."""
+    cls = value.__class__
+    if cls is not Ok and cls is not Err:
+        raise TypeError(f"flatten() expected Ok to hold a Result, got {cls.__name__}")
+    return value
+
+
+# Per-op source for `_compile_pipeline`: the variant an op runs on, and its body.
+# `r` is the running Result and `f{i}` the op's callable; each body mirrors the
+# matching branch of `_run_operations`. map/map_err leave their output in `v` and
+# read `{arg}`, so a run of them is wrapped back into a Result only once. Ops
+# tagged ASYNC await their fn directly; untagged and_then/or_else skip the
+# `isawaitable` check when fn returned a Result.
+_OP_TEMPLATES: dict[int, tuple[str, str]] = {
+    MAP: (
+        "Ok",
+        """
+        v = f{i}({arg})
+        if isawaitable(v):
+            v = await v""",
+    ),
+    MAP_ERR: (
+        "Err",
+        """
+        v = f{i}({arg})
+        if isawaitable(v):
+            v = await v""",
+    ),
+    AND_THEN: (
+        "Ok",
+        """
+        r = f{i}(r._value)
+        if type(r) is not Ok and type(r) is not Err and isawaitable(r):
+            r = await r""",
+    ),
+    OR_ELSE: (
+        "Err",
+        """
+        r = f{i}(r._error)
+        if type(r) is not Ok and type(r) is not Err and isawaitable(r):
+            r = await r""",
+    ),
+    TEE: (
+        "Ok",
+        """
+        v = f{i}(r._value)
+        if isawaitable(v):
+            await v""",
+    ),
+    INSPECT_ERR: (
+        "Err",
+        """
+        v = f{i}(r._error)
+        if isawaitable(v):
+            await v""",
+    ),
+    FLATTEN: ("Ok", "\n        r = _flattened(r._value)"),
+    MAP | ASYNC: ("Ok", "\n        v = await f{i}({arg})"),
+    MAP_ERR | ASYNC: ("Err", "\n        v = await f{i}({arg})"),
+    AND_THEN | ASYNC: ("Ok", "\n        r = await f{i}(r._value)"),
+    OR_ELSE | ASYNC: ("Err", "\n        r = await f{i}(r._error)"),
+    TEE | ASYNC: ("Ok", "\n        await f{i}(r._value)"),
+    INSPECT_ERR | ASYNC: ("Err", "\n        await f{i}(r._error)"),
+}
+
+# Ops that never change the variant of `r`, so the next op on the same variant
+# can share their guard. A run of them is skipped by a single type check.
+_KEEPS_VARIANT = frozenset({MAP, MAP_ERR, TEE, INSPECT_ERR})
+
+_PAYLOAD = {"Ok": "r._value", "Err": "r._error"}
+
+_COMPILE_MAX_OPS = 16
+"""Longer chains run through the loop in `collect` instead of generated code."""
+
+
+@lru_cache(maxsize=256)
+def _compile_pipeline(shape: tuple[int, ...]) -> Callable[..., Coroutine[Any, Any, Ok[Any] | Err[Any]]]:
+    """Generate a straight-line coroutine function for a chain of op tags.
+
+    The generated function takes the source and the `(tag, fn)` op tuple and
+    unpacks the callables itself, so the code depends only on the shape of the
+    chain and is shared by every chain with the same op tags.
+    """
+    body = ["    if type(r) is not Ok and type(r) is not Err and isawaitable(r):\n        r = await r"]
+    if shape:
+        body.insert(0, "    " + "".join(f"(_, f{i}), " for i in range(len(shape))) + "= ops")
+    guard = None
+    pending = False  # `v` holds a mapped payload not yet wrapped back into `guard`
+    for i, tag in enumerate(shape):
+        variant, step = _OP_TEMPLATES[tag]
+        kind = tag & ~ASYNC
+        fuse = pending and variant == guard and kind in (MAP, MAP_ERR)
+        if pending and not fuse:
+            if kind == FLATTEN and guard == "Ok":
+                # map(...).flatten(): `v` should be the inner Result, so check it instead of wrapping it.
+                body.append("        r = _flattened(v)")
+                pending, guard = False, None
+                continue
+            body.append(f"        r = {guard}(v)")
+        if variant != guard:
+            body.append(f"    if type(r) is {variant}:")
+        body.append(step.format(i=i, arg="v" if fuse else _PAYLOAD[variant]).lstrip("\n"))
+        pending = kind in (MAP, MAP_ERR)
+        guard = variant if kind in _KEEPS_VARIANT else None
+    if pending:
+        body.append(f"        r = {guard}(v)")
+    source = "async def _pipeline(r, ops):\n" + "\n".join(body) + "\n    return r\n"
+    namespace: dict[str, Any] = {"Ok": Ok, "Err": Err, "isawaitable": isawaitable, "_flattened": _flattened}
+    # `source` is assembled only from the fixed templates above.
+    exec(source, namespace)
+    return cast(Callable[..., Coroutine[Any, Any, Ok[Any] | Err[Any]]], namespace["_pipeline"])
+
+
+# A single flat dispatch keeps the per-op cost low, hence the complexity waiver.
+async def _run_operations(result: Any, ops: tuple[ResultOperation, ...]) -> Any:  # noqa: C901
+    """Execute `ops` on `result` one by one (used for chains too long to compile)."""
+    if type(result) is not Ok and type(result) is not Err and isawaitable(result):
+        result = await result
+    for tag, fn in ops:
+        tag &= ~ASYNC
+        if type(result) is Ok:
+            if tag == MAP:
+                value = fn(result._value)  # type: ignore[misc]
+                if isawaitable(value):
+                    value = await value
+                result = Ok(value)
+            elif tag == AND_THEN:
+                result = fn(result._value)  # type: ignore[misc]
+                if isawaitable(result):
+                    result = await result
+            elif tag == TEE:
+                value = fn(result._value)  # type: ignore[misc]
+                if isawaitable(value):
+                    await value
+            elif tag == FLATTEN:
+                result = _flattened(result._value)
+        elif tag == MAP_ERR:
+            error = fn(result._error)  # type: ignore[misc]
+            if isawaitable(error):
+                error = await error
+            result = Err(error)
+        elif tag == OR_ELSE:
+            result = fn(result._error)  # type: ignore[misc]
+            if isawaitable(result):
+                result = await result
+        elif tag == INSPECT_ERR:
+            error = fn(result._error)  # type: ignore[misc]
+            if isawaitable(error):
+                await error
+    return result
 
 
 class LazyResult(Generic[T, E]):
@@ -436,8 +574,10 @@ class LazyResult(Generic[T, E]):
         ```
 
     Note:
-        Operations are stored as frozen dataclasses and executed
-        sequentially. Short-circuiting occurs on Err values.
+        Operations are stored as `(tag, fn)` tuples and executed
+        sequentially. Short-circuiting occurs on Err values. Chains of
+        up to 16 operations run through generated straight-line code
+        that is cached per sequence of operation types.
     """
 
     __slots__ = ("_source", "_operations")
@@ -476,84 +616,41 @@ class LazyResult(Generic[T, E]):
 
     def map(self, fn: Callable[[T], U | Awaitable[U]]) -> LazyResult[U, E]:
         """Transform Ok value. fn can be sync or async."""
-        return cast(LazyResult[U, E], LazyResult(self._source, (*self._operations, ResultMapOp(fn))))
+        return cast(LazyResult[U, E], LazyResult(self._source, (*self._operations, (_tag(MAP, fn), fn))))
 
     def map_err(self, fn: Callable[[E], F | Awaitable[F]]) -> LazyResult[T, F]:
         """Transform Err value. fn can be sync or async."""
-        return cast(LazyResult[T, F], LazyResult(self._source, (*self._operations, ResultMapErrOp(fn))))
+        return cast(LazyResult[T, F], LazyResult(self._source, (*self._operations, (_tag(MAP_ERR, fn), fn))))
 
     def and_then(self, fn: Callable[[T], Ok[U] | Err[E] | Awaitable[Ok[U] | Err[E]]]) -> LazyResult[U, E]:
         """Chain Result-returning function. fn can be sync or async."""
-        return cast(LazyResult[U, E], LazyResult(self._source, (*self._operations, ResultAndThenOp(fn))))
+        return cast(LazyResult[U, E], LazyResult(self._source, (*self._operations, (_tag(AND_THEN, fn), fn))))
 
     def or_else(self, fn: Callable[[E], Ok[T] | Err[F] | Awaitable[Ok[T] | Err[F]]]) -> LazyResult[T, F]:
         """Recover from Err. fn can be sync or async."""
-        return cast(LazyResult[T, F], LazyResult(self._source, (*self._operations, ResultOrElseOp(fn))))
+        return cast(LazyResult[T, F], LazyResult(self._source, (*self._operations, (_tag(OR_ELSE, fn), fn))))
 
     def tee(self, fn: Callable[[T], Any]) -> LazyResult[T, E]:
         """Side effect on Ok value. fn can be sync or async."""
-        return LazyResult(self._source, (*self._operations, ResultTeeOp(fn)))
+        return LazyResult(self._source, (*self._operations, (_tag(TEE, fn), fn)))
 
     inspect = tee
 
     def inspect_err(self, fn: Callable[[E], Any]) -> LazyResult[T, E]:
         """Side effect on Err value. fn can be sync or async."""
-        return LazyResult(self._source, (*self._operations, ResultInspectErrOp(fn)))
+        return LazyResult(self._source, (*self._operations, (_tag(INSPECT_ERR, fn), fn)))
 
     def flatten(self: LazyResult[Ok[U] | Err[E], E]) -> LazyResult[U, E]:
         """Flatten nested LazyResult[Result[U, E], E] to LazyResult[U, E]."""
-        return cast(LazyResult[U, E], LazyResult(self._source, (*self._operations, ResultFlattenOp())))
+        return cast(LazyResult[U, E], LazyResult(self._source, (*self._operations, (FLATTEN, None))))
 
     async def collect(self) -> Ok[T] | Err[E]:
         """Execute the lazy chain and return the final Result."""
-        result: Ok[Any] | Err[Any] = await _maybe_await(self._source)
-
-        for op in self._operations:
-            result = await self._execute_op(result, op)
-
-        return result
-
-    async def _execute_op(self, result: Ok[Any] | Err[Any], op: ResultOperation) -> Ok[Any] | Err[Any]:
-        """Execute a single operation on a Result."""
-        match op:
-            case ResultMapOp(fn):
-                if result.is_ok():
-                    value = await _maybe_await(fn(result.unwrap()))
-                    return Ok(value)
-                return result
+        ops = self._operations
+        if len(ops) <= _COMPILE_MAX_OPS:
+            return await _compile_pipeline(tuple([tag for tag, _ in ops]))(self._source, ops)
 
-            case ResultMapErrOp(fn):
-                if result.is_err():
-                    error = await _maybe_await(fn(result.unwrap_err()))
-                    return Err(error)
-                return result
-
-            case ResultAndThenOp(fn):
-                if result.is_ok():
-                    return await _maybe_await(fn(result.unwrap()))
-                return result
-
-            case ResultOrElseOp(fn):
-                if result.is_err():
-                    return await _maybe_await(fn(result.unwrap_err()))
-                return result
-
-            case ResultTeeOp(fn):
-                if result.is_ok():
-                    await _maybe_await(fn(result.unwrap()))
-                return result
-
-            case ResultInspectErrOp(fn):
-                if result.is_err():
-                    await _maybe_await(fn(result.unwrap_err()))
-                return result
-
-            case ResultFlattenOp():
-                if result.is_ok():
-                    return result.unwrap()
-                return result
-
-        return result
+        return cast(Ok[T] | Err[E], await _run_operations(self._source, ops))
 
 
 def sequence_results(results: Iterable[Ok[T] | Err[E]]) -> Ok[list[T]] | Err[E]:
@@ -576,10 +673,15 @@ def sequence_results(results: Iterable[Ok[T] | Err[E]]) -> Ok[list[T]] | Err[E]:
         ```
     """
     values: list[T] = []
+    append = values.append
     for r in results:
-        if r.is_err():
-            return Err(r.unwrap_err())
-        values.append(r.unwrap())
+        # Ok is final, so isinstance is an exact-type check here; unlike
+        # `type(r) is Err`, it also lets ty narrow the else branch to Err.
+        if isinstance(r, Ok):
+            append(r._value)
+        else:
+            # Err carries no T, so the existing instance is already a valid Result[list[T], E].
+            return r
     return Ok(values)
 
 
@@ -608,7 +710,15 @@ def traverse_results(items: Iterable[U], fn: Callable[[U], Ok[T] | Err[E]]) -> O
         traverse_results(["1", "x", "3"], parse_int)  # Err('invalid: x')
         ```
     """
-    return sequence_results(fn(item) for item in items)
+    values: list[T] = []
+    append = values.append
+    for item in items:
+        r = fn(item)
+        if isinstance(r, Ok):
+            append(r._value)
+        else:
+            return r
+    return Ok(values)
 
 
 def is_ok(result: Ok[T] | Err[E]) -> TypeIs[Ok[T]]:
@@ -1,3 +1,4 @@
+# pyright: reportUnnecessaryTypeIgnoreComment=false
 """JSON serialization support for Result and Option types.
 
 This module provides JSON encoder/decoder support for Ok, Err, Some, and Nothing types.
@@ -32,19 +33,87 @@ Example:
     >>> decoded = json.loads(encoded, object_hook=result_decoder)
     >>> decoded == original
     True
+
+Fast path:
+    `dumps_fast`, `dumps_bytes` and `loads_fast` use orjson when it is installed
+    (`pip install unwrappy[orjson]`) and fall back to the stdlib json module
+    otherwise. They produce compact JSON in the same tagged format, but orjson
+    rejects integers beyond 64 bits, writes NaN/Infinity as null, and refuses
+    NaN/Infinity literals when parsing, where the stdlib accepts them. orjson
+    also caps nesting: it will not serialize values nested deeper than about
+    255 levels or parse documents nested deeper than 1024.
 """
 
 from __future__ import annotations
 
 import json
-from typing import Any
+from collections.abc import Callable
+from json.encoder import encode_basestring_ascii
+from typing import IO, Any
 
 from unwrappy.option import NOTHING, LazyOption, Some, _NothingType
 from unwrappy.result import Err, LazyResult, Ok
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    orjson = None  # type: ignore[assignment]
+
 _TYPE_KEY = "__unwrappy_type__"
 
 
+def _encode_ok(o: Ok[Any]) -> dict[str, Any]:
+    return {_TYPE_KEY: "Ok", "value": o._value}
+
+
+def _encode_err(o: Err[Any]) -> dict[str, Any]:
+    return {_TYPE_KEY: "Err", "error": o._error}
+
+
+def _encode_some(o: Some[Any]) -> dict[str, Any]:
+    return {_TYPE_KEY: "Some", "value": o._value}
+
+
+def _encode_nothing(o: _NothingType) -> dict[str, Any]:
+    return {_TYPE_KEY: "Nothing"}
+
+
+# Keyed by concrete type: one dict lookup replaces a chain of isinstance checks,
+# which matters because `default` is also called for every non-Result object.
+# Ok and Err are final; subclasses of Some and _NothingType miss this table and
+# are picked up by `_subclass_encoder`.
+_ENCODERS: dict[type, Callable[[Any], dict[str, Any]]] = {
+    Ok: _encode_ok,
+    Err: _encode_err,
+    Some: _encode_some,
+    _NothingType: _encode_nothing,
+}
+
+
+def _subclass_encoder(o: Any) -> Callable[[Any], dict[str, Any]] | None:
+    """Return the encoder for a subclass of Some or _NothingType, if o is one."""
+    if isinstance(o, Some):
+        return _encode_some
+
+    if isinstance(o, _NothingType):
+        return _encode_nothing
+
+    return None
+
+
+def _reject_lazy(o: Any) -> None:
+    """Raise TypeError if o is a LazyResult or LazyOption."""
+    if isinstance(o, LazyResult):
+        raise TypeError(
+            "Cannot JSON serialize LazyResult. Call .collect() first to obtain a concrete Result, then serialize that."
+        )
+
+    if isinstance(o, LazyOption):
+        raise TypeError(
+            "Cannot JSON serialize LazyOption. Call .collect() first to obtain a concrete Option, then serialize that."
+        )
+
+
 class ResultEncoder(json.JSONEncoder):
     """JSON encoder for Result and Option types.
 
@@ -73,31 +142,26 @@ class ResultEncoder(json.JSONEncoder):
         Raises:
             TypeError: If o is a LazyResult or LazyOption.
         """
-        if isinstance(o, Ok):
-            return {_TYPE_KEY: "Ok", "value": o.unwrap()}
-
-        if isinstance(o, Err):
-            return {_TYPE_KEY: "Err", "error": o.unwrap_err()}
-
-        if isinstance(o, Some):
-            return {_TYPE_KEY: "Some", "value": o.unwrap()}
+        encode = _ENCODERS.get(o.__class__) or _subclass_encoder(o)
+        if encode is not None:
+            return encode(o)
 
-        if isinstance(o, _NothingType):
-            return {_TYPE_KEY: "Nothing"}
+        _reject_lazy(o)
+        return super().default(o)
 
-        if isinstance(o, LazyResult):
-            raise TypeError(
-                "Cannot JSON serialize LazyResult. "
-                "Call .collect() first to obtain a concrete Result, then serialize that."
-            )
 
-        if isinstance(o, LazyOption):
-            raise TypeError(
-                "Cannot JSON serialize LazyOption. "
-                "Call .collect() first to obtain a concrete Option, then serialize that."
-            )
+# Shared by `dumps` calls without options, as json.dumps does with its own default
+# encoder; saves constructing a ResultEncoder per call.
+_DEFAULT_ENCODER = ResultEncoder()
 
-        return super().default(o)
+# JSON for scalar payloads, keyed by exact type and matching _DEFAULT_ENCODER's
+# output, so `dumps(Ok(42))` can be formatted without running the encoder.
+_SCALAR_JSON: dict[type, Callable[[Any], str]] = {
+    int: int.__repr__,
+    str: encode_basestring_ascii,
+    bool: lambda v: "true" if v else "false",
+    type(None): lambda v: "null",
+}
 
 
 def result_decoder(dct: dict[str, Any]) -> Any:
@@ -177,6 +241,14 @@ def dumps(obj: Any, **kwargs: Any) -> str:
         >>> dumps(Ok(42))
         '{"__unwrappy_type__": "Ok", "value": 42}'
     """
+    if not kwargs:
+        t = obj.__class__
+        if t is Ok or t is Err:
+            key, payload = ("value", obj._value) if t is Ok else ("error", obj._error)
+            scalar = _SCALAR_JSON.get(payload.__class__)
+            if scalar is not None:
+                return f'{{"{_TYPE_KEY}": "{t.__name__}", "{key}": {scalar(payload)}}}'
+        return _DEFAULT_ENCODER.encode(obj)
     return json.dumps(obj, cls=ResultEncoder, **kwargs)
 
 
@@ -198,3 +270,155 @@ def loads(s: str, **kwargs: Any) -> Any:
         Ok(42)
     """
     return json.loads(s, object_hook=result_decoder, **kwargs)
+
+
+def dump(obj: Any, fp: IO[str], **kwargs: Any) -> None:
+    """Serialize obj as JSON to a text file with Result type support.
+
+    Convenience wrapper around json.dump with ResultEncoder. The output is
+    written chunk by chunk, so the whole document is never held in memory.
+
+    Args:
+        obj: Object to serialize.
+        fp: Writable text file-like object.
+        **kwargs: Additional arguments passed to json.dump.
+
+    Example:
+        >>> import io
+        >>> from unwrappy import Ok
+        >>> from unwrappy.serde import dump
+        >>> buffer = io.StringIO()
+        >>> dump(Ok(42), buffer)
+        >>> buffer.getvalue()
+        '{"__unwrappy_type__": "Ok", "value": 42}'
+    """
+    json.dump(obj, fp, cls=ResultEncoder, **kwargs)
+
+
+def load(fp: IO[str], **kwargs: Any) -> Any:
+    """Deserialize JSON from a text file with Result type support.
+
+    Convenience wrapper around json.load with result_decoder.
+
+    Args:
+        fp: Readable text file-like object.
+        **kwargs: Additional arguments passed to json.load.
+
+    Returns:
+        Deserialized object with Result types restored.
+
+    Example:
+        >>> import io
+        >>> from unwrappy.serde import load
+        >>> load(io.StringIO('{"__unwrappy_type__": "Ok", "value": 42}'))
+        Ok(42)
+    """
+    return json.load(fp, object_hook=result_decoder, **kwargs)
+
+
+def _orjson_default(o: Any) -> Any:
+    """Encode Result and Option values for orjson's `default` hook; reject anything else."""
+    encode = _ENCODERS.get(o.__class__) or _subclass_encoder(o)
+    if encode is not None:
+        return encode(o)
+
+    _reject_lazy(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def _revive(o: Any) -> Any:
+    """Rewrite tagged dicts in a parsed JSON tree into Result and Option values, in place."""
+    t = o.__class__
+    if t is not dict and t is not list:
+        return o
+
+    # Walk with an explicit stack, recording where each nested dict lives. Slots are
+    # found parents-first, so replaying them in reverse decodes every dict after the
+    # dicts inside it, as object_hook would.
+    slots: list[tuple[Any, Any]] = []
+    root: dict[Any, Any] | list[Any] = o
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        for k, v in node.items() if type(node) is dict else enumerate(node):
+            t = v.__class__
+            if t is dict:
+                slots.append((node, k))
+                stack.append(v)
+            elif t is list:
+                stack.append(v)
+
+    for container, key in reversed(slots):
+        container[key] = result_decoder(container[key])
+    return result_decoder(root) if type(root) is dict else root
+
+
+def dumps_fast(obj: Any) -> str:
+    """Serialize obj to a compact JSON string with Result type support.
+
+    Uses orjson when available: the tree is walked in C and only Result and
+    Option values call back into Python, through the `default` hook.
+    Without orjson, falls back to json.dumps with ResultEncoder.
+
+    Args:
+        obj: Object to serialize.
+
+    Returns:
+        Compact JSON string (no whitespace after separators).
+
+    Example:
+        >>> from unwrappy import Ok
+        >>> from unwrappy.serde import dumps_fast
+        >>> dumps_fast(Ok(42))
+        '{"__unwrappy_type__":"Ok","value":42}'
+    """
+    if orjson is None:  # pragma: no cover
+        return json.dumps(obj, cls=ResultEncoder, separators=(",", ":"))
+    return orjson.dumps(obj, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes with Result type support.
+
+    Same output as `dumps_fast`, but returns orjson's bytes as-is instead of
+    decoding them to str, for callers that write to sockets, files opened in
+    binary mode, or HTTP responses.
+
+    Args:
+        obj: Object to serialize.
+
+    Returns:
+        Compact JSON document encoded as UTF-8.
+
+    Example:
+        >>> from unwrappy import Ok
+        >>> from unwrappy.serde import dumps_bytes
+        >>> dumps_bytes(Ok(42))
+        b'{"__unwrappy_type__":"Ok","value":42}'
+    """
+    if orjson is None:  # pragma: no cover
+        return json.dumps(obj, cls=ResultEncoder, separators=(",", ":")).encode()
+    return orjson.dumps(obj, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def loads_fast(s: str | bytes) -> Any:
+    """Deserialize a JSON document with Result type support.
+
+    Uses orjson when available: the document is parsed in C, then tagged
+    dicts are rewritten in a single pass over the tree. Without orjson,
+    falls back to json.loads with result_decoder.
+
+    Args:
+        s: JSON string or UTF-8 bytes to deserialize.
+
+    Returns:
+        Deserialized object with Result types restored.
+
+    Example:
+        >>> from unwrappy.serde import loads_fast
+        >>> loads_fast('{"__unwrappy_type__":"Ok","value":42}')
+        Ok(42)
+    """
+    if orjson is None:  # pragma: no cover
+        return json.loads(s, object_hook=result_decoder)
+    return _revive(orjson.loads(s))
@@ -0,0 +1,271 @@
+# pyright: reportAssertTypeFailure=true
+"""Static type assertions for the Result and LazyResult APIs.
+
+Nothing here runs under pytest: the module is not collected, and every check
+sits behind `TYPE_CHECKING`. The assertions are verified by ty and pyright,
+which both cover the tests directory. pyright's config turns off
+reportAssertTypeFailure for tests, so the comment above re-enables it here.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Literal
+
+    from typing_extensions import assert_type
+
+    from unwrappy import LazyResult, Some
+    from unwrappy.result import Err, Ok, Result
+
+    # Basic Result inference
+
+    def check_ok_type_annotated() -> None:
+        ok: Ok[int] = Ok(42)
+        assert_type(ok, Ok[int])
+
+    def check_ok_with_string_annotated() -> None:
+        ok: Ok[str] = Ok("hello")
+        assert_type(ok, Ok[str])
+
+    def check_err_type_annotated() -> None:
+        err: Err[str] = Err("error")
+        assert_type(err, Err[str])
+
+    def check_err_with_int_annotated() -> None:
+        err: Err[int] = Err(404)
+        assert_type(err, Err[int])
+
+    def check_result_union_ok() -> None:
+        result: Result[int, str] = Ok(42)
+        # Type checker narrows to Ok[int] but we annotated as Result[int, str]
+        assert_type(result, Ok[int])
+
+    def check_result_union_err() -> None:
+        result: Result[int, str] = Err("error")
+        # Type checker narrows to Err[str] but we annotated as Result[int, str]
+        assert_type(result, Err[str])
+
+    # map operations
+
+    def check_map_transforms_ok_type() -> None:
+        result: Ok[int] = Ok(42)
+        mapped = result.map(str)
+        assert_type(mapped, Ok[str])
+
+    def check_map_err_transforms_err_type() -> None:
+        result: Err[str] = Err("error")
+        mapped = result.map_err(len)
+        assert_type(mapped, Err[int])
+
+    def check_map_or_return_type() -> None:
+        result: Result[int, str] = Ok(42)
+        value = result.map_or("default", str)
+        assert_type(value, str)
+
+    def check_map_or_else_return_type() -> None:
+        def error_handler(e: str) -> str:
+            return f"error: {e}"
+
+        result: Result[int, str] = Ok(42)
+        value = result.map_or_else(error_handler, str)
+        assert_type(value, str)
+
+    # Chain operations
+
+    def check_and_then_type() -> None:
+        def to_string(x: int) -> Ok[str] | Err[str]:
+            return Ok(str(x))
+
+        result: Ok[int] = Ok(42)
+        chained = result.and_then(to_string)
+        assert_type(chained, Ok[str] | Err[str])
+
+    def check_or_else_type() -> None:
+        def recover(e: str) -> Ok[int] | Err[int]:
+            return Ok(len(e))
+
+        result: Err[str] = Err("error")
+        recovered = result.or_else(recover)
+        assert_type(recovered, Ok[int] | Err[int])
+
+    # unwrap return types
+
+    def check_unwrap_returns_t() -> None:
+        result: Result[int, str] = Ok(42)
+        value = result.unwrap()
+        assert_type(value, int)
+
+    def check_unwrap_err_returns_e() -> None:
+        result: Result[int, str] = Err("error")
+        error = result.unwrap_err()
+        assert_type(error, str)
+
+    def check_ok_method_returns_some() -> None:
+        result: Ok[int] = Ok(42)
+        value = result.ok()
+        assert_type(value, Some[int])
+
+    def check_err_method_returns_some() -> None:
+        result: Err[str] = Err("error")
+        error = result.err()
+        assert_type(error, Some[str])
+
+    def check_unwrap_or_returns_t() -> None:
+        result: Result[int, str] = Ok(42)
+        value = result.unwrap_or(0)
+        assert_type(value, int)
+
+    def check_unwrap_or_else_returns_t() -> None:
+        result: Result[int, str] = Ok(42)
+        value = result.unwrap_or_else(lambda e: 0)
+        assert_type(value, int)
+
+    def check_expect_returns_t() -> None:
+        result: Result[int, str] = Ok(42)
+        value = result.expect("should not fail")
+        assert_type(value, int)
+
+    def check_expect_err_returns_e() -> None:
+        result: Result[int, str] = Err("error")
+        error = result.expect_err("should not fail")
+        assert_type(error, str)
+
+    # Async methods (awaited, as direct coroutine assertions have variance issues)
+
+    async def check_map_async_return_type() -> None:
+        async def async_str(x: int) -> str:
+            return str(x)
+
+        result: Ok[int] = Ok(42)
+        awaited = await result.map_async(async_str)
+        assert_type(awaited, Ok[str])
+
+    async def check_map_err_async_return_type() -> None:
+        async def async_len(s: str) -> int:
+            return len(s)
+
+        result: Ok[int] = Ok(42)
+        awaited = await result.map_err_async(async_len)
+        assert_type(awaited, Ok[int])
+
+    async def check_and_then_async_return_type() -> None:
+        async def async_to_string(x: int) -> Ok[str] | Err[str]:
+            return Ok(str(x))
+
+        result: Ok[int] = Ok(42)
+        awaited = await result.and_then_async(async_to_string)
+        assert_type(awaited, Ok[str] | Err[str])
+
+    async def check_or_else_async_return_type() -> None:
+        async def async_recover(e: str) -> Ok[int] | Err[int]:
+            return Ok(len(e))
+
+        result: Err[str] = Err("error")
+        awaited = await result.or_else_async(async_recover)
+        assert_type(awaited, Ok[int] | Err[int])
+
+    # Predicates
+
+    def check_is_ok_returns_literal_true() -> None:
+        result: Ok[int] = Ok(42)
+        is_ok = result.is_ok()
+        assert_type(is_ok, Literal[True])
+
+    def check_is_err_returns_literal_true() -> None:
+        result: Err[str] = Err("error")
+        is_err = result.is_err()
+        assert_type(is_err, Literal[True])
+
+    # LazyResult factory methods
+    # Note: ty has known limitations with generic TypeVar inference (astral-sh/ty#501)
+    # These assert_type tests document expected types but ty infers Unknown instead
+    async def check_lazy_ok_type() -> None:
+        lazy = LazyResult.ok(42)
+        result = await lazy.collect()
+        assert_type(result, Result[int, Any])  # ty: ignore[type-assertion-failure]
+
+    async def check_lazy_err_type() -> None:
+        lazy = LazyResult.err("error")
+        result = await lazy.collect()
+        assert_type(result, Result[Any, str])  # ty: ignore[type-assertion-failure]
+
+    def check_lazy_from_result_type() -> None:
+        lazy = LazyResult.from_result(Ok(42))
+        assert_type(lazy, LazyResult[int, Any])  # ty: ignore[type-assertion-failure]  # pyright: ignore[reportAssertTypeFailure]
+
+    # map - transforms T to U, preserves E
+    def check_lazy_map_type() -> None:
+        lazy: LazyResult[int, str] = LazyResult.from_result(Ok(42))
+        mapped = lazy.map(str)
+        assert_type(mapped, LazyResult[str, str])  # ty: ignore[type-assertion-failure]
+
+    def check_lazy_map_chain_type() -> None:
+        lazy: LazyResult[int, str] = LazyResult.from_result(Ok(42))
+        chained = lazy.map(str).map(len)
+        assert_type(chained, LazyResult[int, str])  # ty: ignore[type-assertion-failure]
+
+    # map_err - transforms E to F, preserves T
+    def check_lazy_map_err_type() -> None:
+        lazy: LazyResult[int, str] = LazyResult.from_result(Err("error"))
+        mapped = lazy.map_err(len)
+        assert_type(mapped, LazyResult[int, int])  # ty: ignore[type-assertion-failure]
+
+    # and_then - transforms T to U via Result[U, E]
+    def check_lazy_and_then_type() -> None:
+        def to_string(x: int) -> Result[str, str]:
+            return Ok(str(x))
+
+        lazy: LazyResult[int, str] = LazyResult.from_result(Ok(42))
+        chained = lazy.and_then(to_string)
+        assert_type(chained, LazyResult[str, str])  # ty: ignore[type-assertion-failure]
+
+    # or_else - transforms E to F via Result[T, F]
+    def check_lazy_or_else_type() -> None:
+        def recover(e: str) -> Result[int, int]:
+            return Ok(len(e))
+
+        lazy: LazyResult[int, str] = LazyResult.from_result(Err("error"))
+        recovered = lazy.or_else(recover)
+        assert_type(recovered, LazyResult[int, int])  # ty: ignore[type-assertion-failure]
+
+    # tee - preserves T and E (side effect only)
+    def check_lazy_tee_type() -> None:
+        lazy: LazyResult[int, str] = LazyResult.from_result(Ok(42))
+        teed = lazy.tee(print)
+        assert_type(teed, LazyResult[int, str])  # ty: ignore[type-assertion-failure]
+
+    # inspect (alias for tee)
+    def check_lazy_inspect_type() -> None:
+        lazy: LazyResult[int, str] = LazyResult.from_result(Ok(42))
+        inspected = lazy.inspect(print)
+        assert_type(inspected, LazyResult[int, str])  # ty: ignore[type-assertion-failure]
+
+    # inspect_err - preserves T and E (side effect only)
+    def check_lazy_inspect_err_type() -> None:
+        lazy: LazyResult[int, str] = LazyResult.from_result(Err("error"))
+        inspected = lazy.inspect_err(print)
+        assert_type(inspected, LazyResult[int, str])  # ty: ignore[type-assertion-failure]
+
+    # flatten - Result[Result[U, E], E] -> Result[U, E]
+    def check_lazy_flatten_type() -> None:
+        inner: Result[int, str] = Ok(42)
+        lazy: LazyResult[Result[int, str], str] = LazyResult.from_result(Ok(inner))
+        flattened = lazy.flatten()
+        assert_type(flattened, LazyResult[int, str])  # ty: ignore[type-assertion-failure]
+
+    # collect - LazyResult[T, E] -> Result[T, E]
+    async def check_lazy_collect_type() -> None:
+        lazy: LazyResult[int, str] = LazyResult.from_result(Ok(42))
+        result = await lazy.collect()
+        assert_type(result, Result[int, str])  # ty: ignore[type-assertion-failure]
+
+    # Complex chain preserves final types
+    def check_lazy_complex_chain_type() -> None:
+        def validate(x: int) -> Result[str, str]:
+            return Ok(str(x)) if x > 0 else Err("negative")
+
+        lazy: LazyResult[int, str] = LazyResult.from_result(Ok(42))
+        chained = lazy.map(lambda x: x * 2).and_then(validate).map(len)
+        assert_type(chained, LazyResult[int, str])  # ty: ignore[type-assertion-failure]
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Literal
+from collections.abc import Callable
+from typing import Any, Literal, TypeAlias
 
 import pytest
 from typing_extensions import assert_type
@@ -18,6 +19,43 @@ from unwrappy.option import (
     traverse_options,
 )
 
+Capture: TypeAlias = tuple[list[Any], Callable[[Any], None]]
+
+
+@pytest.fixture
+def capture() -> Capture:
+    """Provide a list and its bound `append` for use as a side-effect callback."""
+    buf: list[Any] = []
+    return buf, buf.append
+
+
+def _double(x: int) -> int:
+    return x * 2
+
+
+def _add(a: int, b: int) -> int:
+    return a + b
+
+
+async def _async_double(x: int) -> int:
+    return x * 2
+
+
+async def _async_maybe_double(x: int) -> Some[int] | _NothingType:
+    return Some(x * 2) if x > 0 else NOTHING
+
+
+async def _async_recover() -> Some[int] | _NothingType:
+    return Some(42)
+
+
+def _assert_same_option(actual: object, expected: object) -> None:
+    """Compare by value, or by identity when the NOTHING singleton is expected."""
+    if expected is NOTHING:
+        assert actual is NOTHING
+    else:
+        assert actual == expected
+
 
 class TestSomeBasics:
     """Tests for Some variant basic behavior."""
@@ -91,42 +129,31 @@ class TestNothingBasics:
 class TestUnwrapMethods:
     """Tests for unwrap_or, unwrap_or_else, unwrap_or_raise, expect, expect_nothing."""
 
-    def test_unwrap_or_on_some(self) -> None:
-        assert Some(5).unwrap_or(0) == 5
-
-    def test_unwrap_or_on_nothing(self) -> None:
-        option: Option[int] = NOTHING
-        assert option.unwrap_or(0) == 0
-
-    def test_unwrap_or_else_on_some(self) -> None:
-        assert Some(5).unwrap_or_else(lambda: 0) == 5
-
-    def test_unwrap_or_else_on_nothing(self) -> None:
-        option: Option[int] = NOTHING
-        assert option.unwrap_or_else(lambda: 42) == 42
-
-    def test_expect_on_some(self) -> None:
-        assert Some(5).expect("should not fail") == 5
+    @pytest.mark.parametrize(
+        ("option", "method", "args", "expected"),
+        [
+            pytest.param(Some(5), "unwrap_or", (0,), 5, id="unwrap_or_on_some"),
+            pytest.param(NOTHING, "unwrap_or", (0,), 0, id="unwrap_or_on_nothing"),
+            pytest.param(Some(5), "unwrap_or_else", (lambda: 0,), 5, id="unwrap_or_else_on_some"),
+            pytest.param(NOTHING, "unwrap_or_else", (lambda: 42,), 42, id="unwrap_or_else_on_nothing"),
+            pytest.param(Some(5), "expect", ("should not fail",), 5, id="expect_on_some"),
+            pytest.param(NOTHING, "expect_nothing", ("should not fail",), None, id="expect_nothing_on_nothing"),
+            pytest.param(Some(5), "unwrap_or_raise", (ValueError("error"),), 5, id="unwrap_or_raise_on_some"),
+        ],
+    )
+    def test_unwrap(self, option: Option[int], method: str, args: tuple[Any, ...], expected: object) -> None:
+        assert getattr(option, method)(*args) == expected
 
     def test_expect_on_nothing_raises(self) -> None:
-        with pytest.raises(UnwrapError) as exc_info:
+        with pytest.raises(UnwrapError, match="custom message") as exc_info:
             NOTHING.expect("custom message")
-        assert "custom message" in str(exc_info.value)
         assert exc_info.value.value is None
 
-    def test_expect_nothing_on_nothing(self) -> None:
-        assert NOTHING.expect_nothing("should not fail") is None
-
     def test_expect_nothing_on_some_raises(self) -> None:
-        with pytest.raises(UnwrapError) as exc_info:
+        with pytest.raises(UnwrapError, match=r"custom message.*5") as exc_info:
             Some(5).expect_nothing("custom message")
-        assert "custom message" in str(exc_info.value)
-        assert "5" in str(exc_info.value)
         assert exc_info.value.value == 5
 
-    def test_unwrap_or_raise_on_some(self) -> None:
-        assert Some(5).unwrap_or_raise(ValueError("error")) == 5
-
     def test_unwrap_or_raise_on_nothing(self) -> None:
         with pytest.raises(ValueError) as exc_info:
             NOTHING.unwrap_or_raise(ValueError("no value"))
@@ -136,54 +163,37 @@ class TestUnwrapMethods:
 class TestMapCombinators:
     """Tests for map, map_or, map_or_else."""
 
-    def test_map_on_some(self) -> None:
-        assert Some(2).map(lambda x: x * 2) == Some(4)
-
-    def test_map_on_nothing(self) -> None:
-        option: Option[int] = NOTHING
-        assert option.map(lambda x: x * 2) is NOTHING
-
-    def test_map_or_on_some(self) -> None:
-        assert Some(2).map_or(0, lambda x: x * 2) == 4
-
-    def test_map_or_on_nothing(self) -> None:
-        option: Option[int] = NOTHING
-        assert option.map_or(0, lambda x: x * 2) == 0
-
-    def test_map_or_else_on_some(self) -> None:
-        assert Some(2).map_or_else(lambda: -1, lambda x: x * 2) == 4
-
-    def test_map_or_else_on_nothing(self) -> None:
-        option: Option[int] = NOTHING
-        assert option.map_or_else(lambda: -1, lambda x: x * 2) == -1
+    @pytest.mark.parametrize(
+        ("option", "method", "args", "expected"),
+        [
+            pytest.param(Some(2), "map", (_double,), Some(4), id="map_on_some"),
+            pytest.param(NOTHING, "map", (_double,), NOTHING, id="map_on_nothing"),
+            pytest.param(Some(2), "map_or", (0, _double), 4, id="map_or_on_some"),
+            pytest.param(NOTHING, "map_or", (0, _double), 0, id="map_or_on_nothing"),
+            pytest.param(Some(2), "map_or_else", (lambda: -1, _double), 4, id="map_or_else_on_some"),
+            pytest.param(NOTHING, "map_or_else", (lambda: -1, _double), -1, id="map_or_else_on_nothing"),
+        ],
+    )
+    def test_map(self, option: Option[int], method: str, args: tuple[Any, ...], expected: object) -> None:
+        _assert_same_option(getattr(option, method)(*args), expected)
 
 
 class TestChainCombinators:
     """Tests for and_then and or_else."""
 
-    def test_and_then_on_some_returns_some(self) -> None:
-        result = Some(2).and_then(lambda x: Some(x * 2))
-        assert result == Some(4)
-
-    def test_and_then_on_some_returns_nothing(self) -> None:
-        result = Some(2).and_then(lambda x: NOTHING)
-        assert result is NOTHING
-
-    def test_and_then_on_nothing(self) -> None:
-        option: Option[int] = NOTHING
-        assert option.and_then(lambda x: Some(x * 2)) is NOTHING
-
-    def test_or_else_on_some(self) -> None:
-        option: Option[int] = Some(5)
-        assert option.or_else(lambda: Some(0)) == Some(5)
-
-    def test_or_else_on_nothing_returns_some(self) -> None:
-        option: Option[int] = NOTHING
-        assert option.or_else(lambda: Some(42)) == Some(42)
-
-    def test_or_else_on_nothing_returns_nothing(self) -> None:
-        option: Option[int] = NOTHING
-        assert option.or_else(lambda: NOTHING) is NOTHING
+    @pytest.mark.parametrize(
+        ("option", "method", "fn", "expected"),
+        [
+            pytest.param(Some(2), "and_then", lambda x: Some(x * 2), Some(4), id="and_then_on_some_returns_some"),
+            pytest.param(Some(2), "and_then", lambda x: NOTHING, NOTHING, id="and_then_on_some_returns_nothing"),
+            pytest.param(NOTHING, "and_then", lambda x: Some(x * 2), NOTHING, id="and_then_on_nothing"),
+            pytest.param(Some(5), "or_else", lambda: Some(0), Some(5), id="or_else_on_some"),
+            pytest.param(NOTHING, "or_else", lambda: Some(42), Some(42), id="or_else_on_nothing_returns_some"),
+            pytest.param(NOTHING, "or_else", lambda: NOTHING, NOTHING, id="or_else_on_nothing_returns_nothing"),
+        ],
+    )
+    def test_chain(self, option: Option[int], method: str, fn: Callable[..., Option[int]], expected: object) -> None:
+        _assert_same_option(getattr(option, method)(fn), expected)
 
 
 class TestFilter:
@@ -196,29 +206,27 @@ class TestFilter:
         assert Some(-1).filter(lambda x: x > 0) is NOTHING
 
     def test_filter_nothing(self) -> None:
-        option: Option[int] = NOTHING
-        assert option.filter(lambda x: x > 0) is NOTHING
+        assert NOTHING.filter(lambda x: x > 0) is NOTHING
 
 
 class TestInspect:
     """Tests for tee/inspect and inspect_nothing."""
 
-    def test_tee_on_some(self) -> None:
-        captured: list[int] = []
-        result = Some(5).tee(lambda x: captured.append(x))
+    def test_tee_on_some(self, capture: Capture) -> None:
+        captured, push = capture
+        result = Some(5).tee(push)
         assert result == Some(5)
         assert captured == [5]
 
-    def test_tee_on_nothing(self) -> None:
-        captured: list[int] = []
-        option: Option[int] = NOTHING
-        result = option.tee(lambda x: captured.append(x))
+    def test_tee_on_nothing(self, capture: Capture) -> None:
+        captured, push = capture
+        result = NOTHING.tee(push)
         assert result is NOTHING
         assert captured == []
 
-    def test_inspect_alias(self) -> None:
-        captured: list[int] = []
-        result = Some(5).inspect(lambda x: captured.append(x))
+    def test_inspect_alias(self, capture: Capture) -> None:
+        captured, push = capture
+        result = Some(5).inspect(push)
         assert result == Some(5)
         assert captured == [5]
 
@@ -239,11 +247,11 @@ class TestFlatten:
     """Tests for flatten method."""
 
     def test_flatten_nested_some(self) -> None:
-        nested: Some[Some[int] | _NothingType] = Some(Some(42))
+        nested = Some(Some(42))
         assert nested.flatten() == Some(42)
 
     def test_flatten_some_nothing(self) -> None:
-        nested: Some[Some[int] | _NothingType] = Some(NOTHING)
+        nested = Some(NOTHING)
         assert nested.flatten() is NOTHING
 
     def test_flatten_nothing(self) -> None:
@@ -263,65 +271,62 @@ class TestToTuple:
 class TestZip:
     """Tests for zip and zip_with."""
 
-    def test_zip_some_some(self) -> None:
-        assert Some(1).zip(Some("a")) == Some((1, "a"))
-
-    def test_zip_some_nothing(self) -> None:
-        assert Some(1).zip(NOTHING) is NOTHING
-
-    def test_zip_nothing_some(self) -> None:
-        option: Option[int] = NOTHING
-        assert option.zip(Some("a")) is NOTHING
-
-    def test_zip_nothing_nothing(self) -> None:
-        option: Option[int] = NOTHING
-        assert option.zip(NOTHING) is NOTHING
-
-    def test_zip_with_some_some(self) -> None:
-        assert Some(2).zip_with(Some(3), lambda a, b: a + b) == Some(5)
-
-    def test_zip_with_some_nothing(self) -> None:
-        assert Some(2).zip_with(NOTHING, lambda a, b: a + b) is NOTHING
-
-    def test_zip_with_nothing_some(self) -> None:
-        option: Option[int] = NOTHING
-        assert option.zip_with(Some(3), lambda a, b: a + b) is NOTHING
+    @pytest.mark.parametrize(
+        ("lhs", "rhs", "expected"),
+        [
+            pytest.param(Some(1), Some("a"), Some((1, "a")), id="some_some"),
+            pytest.param(Some(1), NOTHING, NOTHING, id="some_nothing"),
+            pytest.param(NOTHING, Some("a"), NOTHING, id="nothing_some"),
+            pytest.param(NOTHING, NOTHING, NOTHING, id="nothing_nothing"),
+        ],
+    )
+    def test_zip(self, lhs: Option[int], rhs: Option[str], expected: object) -> None:
+        _assert_same_option(lhs.zip(rhs), expected)
+
+    @pytest.mark.parametrize(
+        ("lhs", "rhs", "expected"),
+        [
+            pytest.param(Some(2), Some(3), Some(5), id="some_some"),
+            pytest.param(Some(2), NOTHING, NOTHING, id="some_nothing"),
+            pytest.param(NOTHING, Some(3), NOTHING, id="nothing_some"),
+        ],
+    )
+    def test_zip_with(self, lhs: Option[int], rhs: Option[int], expected: object) -> None:
+        _assert_same_option(lhs.zip_with(rhs, _add), expected)
 
 
 class TestXor:
     """Tests for xor method."""
 
-    def test_xor_some_some(self) -> None:
-        assert Some(1).xor(Some(2)) is NOTHING
-
-    def test_xor_some_nothing(self) -> None:
-        assert Some(1).xor(NOTHING) == Some(1)
-
-    def test_xor_nothing_some(self) -> None:
-        option: Option[int] = NOTHING
-        assert option.xor(Some(2)) == Some(2)
-
-    def test_xor_nothing_nothing(self) -> None:
-        option: Option[int] = NOTHING
-        assert option.xor(NOTHING) is NOTHING
+    @pytest.mark.parametrize(
+        ("lhs", "rhs", "expected"),
+        [
+            pytest.param(Some(1), Some(2), NOTHING, id="some_some"),
+            pytest.param(Some(1), NOTHING, Some(1), id="some_nothing"),
+            pytest.param(NOTHING, Some(2), Some(2), id="nothing_some"),
+            pytest.param(NOTHING, NOTHING, NOTHING, id="nothing_nothing"),
+        ],
+    )
+    def test_xor(self, lhs: Option[int], rhs: Option[int], expected: object) -> None:
+        _assert_same_option(lhs.xor(rhs), expected)
 
 
 class TestOkOr:
     """Tests for ok_or and ok_or_else."""
 
-    def test_ok_or_on_some(self) -> None:
-        assert Some(5).ok_or("error") == Ok(5)
-
-    def test_ok_or_on_nothing(self) -> None:
-        option: Option[int] = NOTHING
-        assert option.ok_or("error") == Err("error")
-
-    def test_ok_or_else_on_some(self) -> None:
-        assert Some(5).ok_or_else(lambda: "error") == Ok(5)
-
-    def test_ok_or_else_on_nothing(self) -> None:
-        option: Option[int] = NOTHING
-        assert option.ok_or_else(lambda: "computed error") == Err("computed error")
+    @pytest.mark.parametrize(
+        ("option", "method", "arg", "expected"),
+        [
+            pytest.param(Some(5), "ok_or", "error", Ok(5), id="ok_or_on_some"),
+            pytest.param(NOTHING, "ok_or", "error", Err("error"), id="ok_or_on_nothing"),
+            pytest.param(Some(5), "ok_or_else", lambda: "error", Ok(5), id="ok_or_else_on_some"),
+            pytest.param(
+                NOTHING, "ok_or_else", lambda: "computed error", Err("computed error"), id="ok_or_else_on_nothing"
+            ),
+        ],
+    )
+    def test_ok_or(self, option: Option[int], method: str, arg: object, expected: object) -> None:
+        assert getattr(option, method)(arg) == expected
 
 
 class TestPatternMatching:
@@ -412,53 +417,33 @@ class TestAsyncMethods:
 
     @pytest.mark.asyncio
     async def test_map_async_on_some(self) -> None:
-        async def double(x: int) -> int:
-            return x * 2
-
-        result = await Some(5).map_async(double)
+        result = await Some(5).map_async(_async_double)
         assert result == Some(10)
 
     @pytest.mark.asyncio
     async def test_map_async_on_nothing(self) -> None:
-        async def double(x: int) -> int:
-            return x * 2
-
         option: Option[int] = NOTHING
-        result = await option.map_async(double)
+        result = await option.map_async(_async_double)
         assert result is NOTHING
 
     @pytest.mark.asyncio
     async def test_and_then_async_on_some(self) -> None:
-        async def maybe_double(x: int) -> Some[int] | _NothingType:
-            return Some(x * 2) if x > 0 else NOTHING
-
-        result = await Some(5).and_then_async(maybe_double)
+        result = await Some(5).and_then_async(_async_maybe_double)
         assert result == Some(10)
 
     @pytest.mark.asyncio
     async def test_and_then_async_on_nothing(self) -> None:
-        async def maybe_double(x: int) -> Some[int] | _NothingType:
-            return Some(x * 2)
-
-        option: Option[int] = NOTHING
-        result = await option.and_then_async(maybe_double)
+        result = await NOTHING.and_then_async(_async_maybe_double)
         assert result is NOTHING
 
     @pytest.mark.asyncio
     async def test_or_else_async_on_some(self) -> None:
-        async def recover() -> Some[int] | _NothingType:
-            return Some(42)
-
-        result = await Some(5).or_else_async(recover)
+        result = await Some(5).or_else_async(_async_recover)
         assert result == Some(5)
 
     @pytest.mark.asyncio
     async def test_or_else_async_on_nothing(self) -> None:
-        async def recover() -> Some[int] | _NothingType:
-            return Some(42)
-
-        option: Option[int] = NOTHING
-        result = await option.or_else_async(recover)
+        result = await NOTHING.or_else_async(_async_recover)
         assert result == Some(42)
 
 
@@ -496,15 +481,15 @@ class TestLazyOption:
         assert result is NOTHING
 
     @pytest.mark.asyncio
-    async def test_lazy_tee(self) -> None:
-        captured: list[int] = []
-        result = await LazyOption.some(5).tee(lambda x: captured.append(x)).collect()
+    async def test_lazy_tee(self, capture: Capture) -> None:
+        captured, push = capture
+        result = await LazyOption.some(5).tee(push).collect()
         assert result == Some(5)
         assert captured == [5]
 
     @pytest.mark.asyncio
     async def test_lazy_inspect_nothing(self) -> None:
-        called: list[bool] = []
+        called = []
         result = await LazyOption.nothing().inspect_nothing(lambda: called.append(True)).collect()
         assert result is NOTHING
         assert called == [True]
@@ -526,26 +511,17 @@ class TestLazyOption:
 
     @pytest.mark.asyncio
     async def test_lazy_from_awaitable(self) -> None:
-        async def get_option() -> Some[int] | _NothingType:
-            return Some(42)
-
-        result = await LazyOption.from_awaitable(get_option()).map(lambda x: x + 1).collect()
+        result = await LazyOption.from_awaitable(_async_recover()).map(lambda x: x + 1).collect()
         assert result == Some(43)
 
     @pytest.mark.asyncio
     async def test_lazy_with_async_map(self) -> None:
-        async def async_double(x: int) -> int:
-            return x * 2
-
-        result = await LazyOption.some(5).map(async_double).collect()
+        result = await LazyOption.some(5).map(_async_double).collect()
         assert result == Some(10)
 
     @pytest.mark.asyncio
     async def test_lazy_with_async_and_then(self) -> None:
-        async def async_maybe_double(x: int) -> Some[int] | _NothingType:
-            return Some(x * 2) if x > 0 else NOTHING
-
-        result = await LazyOption.some(5).and_then(async_maybe_double).collect()
+        result = await LazyOption.some(5).and_then(_async_maybe_double).collect()
         assert result == Some(10)
 
 
@@ -2,124 +2,294 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Callable, Coroutine, Iterable
 from dataclasses import dataclass
-from typing import Any, Literal
+from functools import partial
+from operator import add
+from types import MethodType
+from typing import Any
+from unittest.mock import Mock
 
 import pytest
 from typing_extensions import assert_type
 
-from unwrappy import LazyResult
+from unwrappy import NOTHING, ChainedError, LazyResult, Some
 from unwrappy.exceptions import UnwrapError
 from unwrappy.result import Err, Ok, Result, is_err, is_ok, sequence_results, traverse_results
 
 
-class TestOkBasics:
-    """Tests for Ok variant basic behavior."""
+class HTTPException(Exception):
+    """Framework-style exception used by the unwrap_or_raise example."""
 
-    def test_ok_is_ok(self) -> None:
-        assert Ok(42).is_ok() is True
+    def __init__(self, status: int, detail: str) -> None:
+        self.status = status
+        self.detail = detail
+        super().__init__(detail)
 
-    def test_ok_is_err(self) -> None:
-        assert Ok(42).is_err() is False
 
-    def test_ok_unwrap(self) -> None:
-        assert Ok(42).unwrap() == 42
+class NotFoundError:
+    """Domain error mapped to HTTPException in the unwrap_or_raise example."""
 
-    def test_ok_unwrap_err_raises(self) -> None:
-        with pytest.raises(UnwrapError) as exc_info:
-            Ok(42).unwrap_err()
-        assert exc_info.value.value == 42
+    def __init__(self, resource: str) -> None:
+        self.resource = resource
 
-    def test_ok_repr(self) -> None:
-        assert repr(Ok(42)) == "Ok(42)"
-        assert repr(Ok("hello")) == "Ok('hello')"
 
-    def test_ok_eq_same_value(self) -> None:
-        assert Ok(1) == Ok(1)
-        assert Ok("hello") == Ok("hello")
+@dataclass
+class User:
+    """Dataclass payload used by test_ok_with_complex_object."""
 
-    def test_ok_eq_different_value(self) -> None:
-        assert Ok(1) != Ok(2)
+    name: str
+    age: int
 
-    def test_ok_eq_different_type(self) -> None:
-        assert Ok(1) != "Ok(1)"
-        assert Ok(1) != 1
 
-    def test_ok_eq_vs_err(self) -> None:
-        assert Ok(1) != Err(1)
+class Doubler:
+    """Owner of the bound async method in test_async_callables_of_every_kind."""
 
+    async def double(self, x: int) -> int:
+        return x * 2
 
-class TestErrBasics:
-    """Tests for Err variant basic behavior."""
 
-    def test_err_is_ok(self) -> None:
-        assert Err("error").is_ok() is False
+class AsyncScale:
+    """Callable object bound with MethodType in test_async_callables_of_every_kind."""
 
-    def test_err_is_err(self) -> None:
-        assert Err("error").is_err() is True
+    async def __call__(self, factor: int, x: int) -> int:
+        return x * factor
 
-    def test_err_unwrap_raises(self) -> None:
-        with pytest.raises(UnwrapError) as exc_info:
-            Err("my error").unwrap()
-        assert exc_info.value.value == "my error"
 
-    def test_err_unwrap_err(self) -> None:
-        assert Err("my error").unwrap_err() == "my error"
+def _to_http(e: NotFoundError) -> HTTPException:
+    return HTTPException(404, f"{e.resource} not found")
 
-    def test_err_repr(self) -> None:
-        assert repr(Err("fail")) == "Err('fail')"
-        assert repr(Err(42)) == "Err(42)"
 
-    def test_err_eq_same_error(self) -> None:
-        assert Err("x") == Err("x")
-        assert Err(42) == Err(42)
+def _parse_int(s: str) -> Result[int, str]:
+    try:
+        return Ok(int(s))
+    except ValueError:
+        return Err(f"Cannot parse '{s}' as int")
 
-    def test_err_eq_different_error(self) -> None:
-        assert Err("x") != Err("y")
 
+def _validate_positive(n: int) -> Result[int, str]:
+    if n > 0:
+        return Ok(n)
+    return Err("Number must be positive")
 
-class TestUnwrapMethods:
-    """Tests for unwrap_or, unwrap_or_else, unwrap_or_raise, expect, expect_err."""
 
-    def test_unwrap_or_on_ok(self) -> None:
-        assert Ok(5).unwrap_or(0) == 5
+async def _async_double(x: int) -> int:
+    return x * 2
 
-    def test_unwrap_or_on_err(self) -> None:
-        result: Result[int, str] = Err("error")
-        assert result.unwrap_or(0) == 0
 
-    def test_unwrap_or_else_on_ok(self) -> None:
-        assert Ok(5).unwrap_or_else(lambda e: len(e)) == 5
+async def _async_upper(s: str) -> str:
+    return s.upper()
+
+
+async def _async_double_result(x: int) -> Result[int, str]:
+    return Ok(x * 2)
+
+
+async def _async_fail(x: int) -> Result[int, str]:
+    return Err("async fail")
+
+
+async def _async_recover(e: str) -> Result[int, str]:
+    return Ok(len(e))
+
+
+async def _async_rewrap(e: str) -> Result[int, str]:
+    return Err(f"new: {e}")
+
+
+async def _async_validate_positive(n: int) -> Result[int, str]:
+    return _validate_positive(n)
+
+
+async def _async_ok() -> Result[int, str]:
+    return Ok(42)
+
+
+async def _async_err() -> Result[int, str]:
+    return Err("async error")
+
+
+async def _async_fetch_user(id: int) -> Result[dict[str, str], str]:
+    return Ok({"name": "Alice", "id": str(id)})
+
+
+def _describe(result: Result[int, str]) -> str:
+    match result:
+        case Ok(value):
+            return f"success: {value}"
+        case Err(error):
+            return f"failure: {error}"
+    raise AssertionError("unreachable")
+
+
+def _double(x: int) -> int:
+    return x * 2
+
+
+def _inc(x: int) -> int:
+    return x + 1
+
 
-    def test_unwrap_or_else_on_err(self) -> None:
-        result: Result[int, str] = Err("abc")
-        assert result.unwrap_or_else(len) == 3
+# Inputs and expected Results are built once at import and shared by every parametrized run.
+_MAP_CASES = [
+    pytest.param(Ok(2), "map", (_double,), Ok(4), id="map_on_ok"),
+    pytest.param(Err("error"), "map", (_double,), Err("error"), id="map_on_err"),
+    pytest.param(Ok(2), "map_or", (0, _double), 4, id="map_or_on_ok"),
+    pytest.param(Err("error"), "map_or", (0, _double), 0, id="map_or_on_err"),
+    pytest.param(Ok(2), "map_or_else", (len, _double), 4, id="map_or_else_on_ok"),
+    pytest.param(Err("abc"), "map_or_else", (len, _double), 3, id="map_or_else_on_err"),
+    pytest.param(Ok(5), "map_err", (str.upper,), Ok(5), id="map_err_on_ok"),
+    pytest.param(Err("err"), "map_err", (str.upper,), Err("ERR"), id="map_err_on_err"),
+]
 
-    def test_expect_on_ok(self) -> None:
-        assert Ok(5).expect("should not fail") == 5
+_CHAIN_CASES = [
+    pytest.param(Ok(2), "and_then", lambda x: Ok(x * 2), Ok(4), id="and_then_on_ok_returns_ok"),
+    pytest.param(Ok(2), "and_then", lambda x: Err("fail"), Err("fail"), id="and_then_on_ok_returns_err"),
+    pytest.param(Err("error"), "and_then", lambda x: Ok(x * 2), Err("error"), id="and_then_on_err"),
+    pytest.param(Ok(5), "or_else", lambda e: Ok(0), Ok(5), id="or_else_on_ok"),
+    pytest.param(Err("error"), "or_else", lambda e: Ok(0), Ok(0), id="or_else_on_err_returns_ok"),
+    pytest.param(
+        Err("error"), "or_else", lambda e: Err("new error"), Err("new error"), id="or_else_on_err_returns_err"
+    ),
+]
+
+
+def _assert_same(actual: object, expected: object) -> None:
+    """Compare by value and exact type, so `True` does not pass for `1`."""
+    assert actual == expected
+    assert type(actual) is type(expected)
+
+
+class TestOkBasics:
+    """Tests for Ok variant basic behavior."""
+
+    @pytest.mark.parametrize(
+        ("result", "method", "expected"),
+        [
+            pytest.param(Ok(42), "is_ok", True, id="ok_is_ok"),
+            pytest.param(Ok(42), "is_err", False, id="ok_is_err"),
+            pytest.param(Ok(42), "unwrap", 42, id="ok_unwrap"),
+            pytest.param(Ok(42), "__repr__", "Ok(42)", id="ok_repr_int"),
+            pytest.param(Ok("hello"), "__repr__", "Ok('hello')", id="ok_repr_str"),
+        ],
+    )
+    def test_ok_behavior(self, result: Ok[Any], method: str, expected: object) -> None:
+        _assert_same(getattr(result, method)(), expected)
+
+    def test_ok_unwrap_err_raises(self) -> None:
+        with pytest.raises(UnwrapError) as exc_info:
+            Ok(42).unwrap_err()
+        assert exc_info.value.value == 42
+
+    @pytest.mark.parametrize(
+        ("lhs", "rhs", "equal"),
+        [
+            pytest.param(Ok(1), Ok(1), True, id="same_value_int"),
+            pytest.param(Ok("hello"), Ok("hello"), True, id="same_value_str"),
+            pytest.param(Ok(1), Ok(2), False, id="different_value"),
+            pytest.param(Ok(1), "Ok(1)", False, id="different_type_str"),
+            pytest.param(Ok(1), 1, False, id="different_type_int"),
+            pytest.param(Ok(1), Err(1), False, id="vs_err"),
+        ],
+    )
+    def test_ok_eq(self, lhs: Ok[Any], rhs: object, equal: bool) -> None:
+        assert (lhs == rhs) is equal
+        assert (lhs != rhs) is not equal
+
+    def test_ok_eq_identity_skips_payload_compare(self) -> None:
+        ok = Ok(float("nan"))
+        same = ok
+        assert ok == same
+
+    def test_ok_hash(self) -> None:
+        assert hash(Ok(1)) == hash(Ok(1))
+        assert hash(Ok(1)) != hash(Err(1))
+        assert {Ok(1), Ok(1), Ok(2)} == {Ok(1), Ok(2)}
+
+    def test_ok_hash_unhashable_value_raises(self) -> None:
+        with pytest.raises(TypeError):
+            hash(Ok([1]))
+
+    def test_ok_has_no_instance_dict(self) -> None:
+        ok = Ok(1)
+        assert not hasattr(ok, "__dict__")
+        with pytest.raises(AttributeError):
+            ok.extra = 2  # pyright: ignore[reportAttributeAccessIssue]
+
+
+class TestErrBasics:
+    """Tests for Err variant basic behavior."""
+
+    @pytest.mark.parametrize(
+        ("result", "method", "expected"),
+        [
+            pytest.param(Err("error"), "is_ok", False, id="err_is_ok"),
+            pytest.param(Err("error"), "is_err", True, id="err_is_err"),
+            pytest.param(Err("my error"), "unwrap_err", "my error", id="err_unwrap_err"),
+            pytest.param(Err("fail"), "__repr__", "Err('fail')", id="err_repr_str"),
+            pytest.param(Err(42), "__repr__", "Err(42)", id="err_repr_int"),
+        ],
+    )
+    def test_err_behavior(self, result: Err[Any], method: str, expected: object) -> None:
+        _assert_same(getattr(result, method)(), expected)
+
+    def test_err_unwrap_raises(self) -> None:
+        with pytest.raises(UnwrapError) as exc_info:
+            Err("my error").unwrap()
+        assert exc_info.value.value == "my error"
+
+    @pytest.mark.parametrize(
+        ("lhs", "rhs", "equal"),
+        [
+            pytest.param(Err("x"), Err("x"), True, id="same_error_str"),
+            pytest.param(Err(42), Err(42), True, id="same_error_int"),
+            pytest.param(Err("x"), Err("y"), False, id="different_error"),
+        ],
+    )
+    def test_err_eq(self, lhs: Err[Any], rhs: object, equal: bool) -> None:
+        assert (lhs == rhs) is equal
+        assert (lhs != rhs) is not equal
+
+    def test_err_hash(self) -> None:
+        assert hash(Err("x")) == hash(Err("x"))
+        assert {Err("x"): 1}[Err("x")] == 1
+
+    def test_err_has_no_instance_dict(self) -> None:
+        err = Err("x")
+        assert not hasattr(err, "__dict__")
+        with pytest.raises(AttributeError):
+            err.extra = 2  # pyright: ignore[reportAttributeAccessIssue]
+
+
+class TestUnwrapMethods:
+    """Tests for unwrap_or, unwrap_or_else, unwrap_or_raise, expect, expect_err."""
+
+    @pytest.mark.parametrize(
+        ("result", "method", "args", "expected"),
+        [
+            pytest.param(Ok(5), "unwrap_or", (0,), 5, id="unwrap_or_on_ok"),
+            pytest.param(Err("error"), "unwrap_or", (0,), 0, id="unwrap_or_on_err"),
+            pytest.param(Ok(5), "unwrap_or_else", (len,), 5, id="unwrap_or_else_on_ok"),
+            pytest.param(Err("abc"), "unwrap_or_else", (len,), 3, id="unwrap_or_else_on_err"),
+            pytest.param(Ok(5), "expect", ("should not fail",), 5, id="expect_on_ok"),
+            pytest.param(Err("error"), "expect_err", ("should not fail",), "error", id="expect_err_on_err"),
+            pytest.param(Ok(5), "unwrap_or_raise", (lambda e: ValueError(str(e)),), 5, id="unwrap_or_raise_on_ok"),
+        ],
+    )
+    def test_unwrap(self, result: Result[int, str], method: str, args: tuple[Any, ...], expected: object) -> None:
+        assert getattr(result, method)(*args) == expected
 
     def test_expect_on_err_raises(self) -> None:
         result: Result[int, str] = Err("error value")
-        with pytest.raises(UnwrapError) as exc_info:
+        with pytest.raises(UnwrapError, match=r"custom message.*error value") as exc_info:
             result.expect("custom message")
-        assert "custom message" in str(exc_info.value)
-        assert "error value" in str(exc_info.value)
         assert exc_info.value.value == "error value"
 
-    def test_expect_err_on_err(self) -> None:
-        assert Err("error").expect_err("should not fail") == "error"
-
     def test_expect_err_on_ok_raises(self) -> None:
-        with pytest.raises(UnwrapError) as exc_info:
+        with pytest.raises(UnwrapError, match=r"custom message.*5") as exc_info:
             Ok(5).expect_err("custom message")
-        assert "custom message" in str(exc_info.value)
-        assert "5" in str(exc_info.value)
         assert exc_info.value.value == 5
 
-    def test_unwrap_or_raise_on_ok(self) -> None:
-        assert Ok(5).unwrap_or_raise(lambda e: ValueError(str(e))) == 5
-
     def test_unwrap_or_raise_on_err(self) -> None:
         result: Result[int, str] = Err("bad input")
         with pytest.raises(ValueError) as exc_info:
@@ -128,23 +298,9 @@ class TestUnwrapMethods:
 
     def test_unwrap_or_raise_http_pattern(self) -> None:
         """Practical example: mapping domain errors to HTTP exceptions."""
-
-        class HTTPException(Exception):
-            def __init__(self, status: int, detail: str) -> None:
-                self.status = status
-                self.detail = detail
-                super().__init__(detail)
-
-        class NotFoundError:
-            def __init__(self, resource: str) -> None:
-                self.resource = resource
-
-        def to_http(e: NotFoundError) -> HTTPException:
-            return HTTPException(404, f"{e.resource} not found")
-
         result: Result[str, NotFoundError] = Err(NotFoundError("User"))
         with pytest.raises(HTTPException) as exc_info:
-            result.unwrap_or_raise(to_http)
+            result.unwrap_or_raise(_to_http)
         assert exc_info.value.status == 404
         assert exc_info.value.detail == "User not found"
 
@@ -153,30 +309,20 @@ class TestAccessorMethods:
     """Tests for ok() and err() accessor methods returning Option."""
 
     def test_ok_method_on_ok(self) -> None:
-        from unwrappy import Some
-
         assert Ok(5).ok() == Some(5)
 
     def test_ok_method_on_err(self) -> None:
-        from unwrappy import NOTHING
-
         result: Result[int, str] = Err("error")
         assert result.ok() is NOTHING
 
     def test_err_method_on_ok(self) -> None:
-        from unwrappy import NOTHING
-
         assert Ok(5).err() is NOTHING
 
     def test_err_method_on_err(self) -> None:
-        from unwrappy import Some
-
         assert Err("error").err() == Some("error")
 
     def test_ok_method_distinguishes_none_value(self) -> None:
         """Test that Ok(None).ok() returns Some(None), not Nothing."""
-        from unwrappy import NOTHING, Some
-
         # This is the key improvement: we can now distinguish
         # Ok(None) from Err(x) via ok()
         assert Ok(None).ok() == Some(None)
@@ -186,136 +332,72 @@ class TestAccessorMethods:
 class TestMapCombinators:
     """Tests for map, map_or, map_or_else, map_err."""
 
-    def test_map_on_ok(self) -> None:
-        assert Ok(2).map(lambda x: x * 2) == Ok(4)
-
-    def test_map_on_err(self) -> None:
-        result: Result[int, str] = Err("error")
-        assert result.map(lambda x: x * 2) == Err("error")
-
-    def test_map_or_on_ok(self) -> None:
-        assert Ok(2).map_or(0, lambda x: x * 2) == 4
-
-    def test_map_or_on_err(self) -> None:
-        result: Result[int, str] = Err("error")
-        assert result.map_or(0, lambda x: x * 2) == 0
+    @pytest.mark.parametrize(("result", "method", "args", "expected"), _MAP_CASES)
+    def test_map(self, result: Result[int, str], method: str, args: tuple[Any, ...], expected: object) -> None:
+        assert getattr(result, method)(*args) == expected
 
-    def test_map_or_else_on_ok(self) -> None:
-        assert Ok(2).map_or_else(len, lambda x: x * 2) == 4
-
-    def test_map_or_else_on_err(self) -> None:
-        result: Result[int, str] = Err("abc")
-        assert result.map_or_else(len, lambda x: x * 2) == 3
-
-    def test_map_err_on_ok(self) -> None:
-        result: Result[int, str] = Ok(5)
-        assert result.map_err(str.upper) == Ok(5)
-
-    def test_map_err_on_err(self) -> None:
-        result: Result[int, str] = Err("err")
-        assert result.map_err(str.upper) == Err("ERR")
+    def test_passthrough_returns_same_instance(self) -> None:
+        ok: Result[int, str] = Ok(5)
+        err: Result[int, str] = Err("error")
+        assert ok.map_err(str.upper) is ok
+        assert ok.or_else(lambda e: Ok(0)) is ok
+        assert err.map(_double) is err
+        assert err.and_then(Ok) is err
+        assert err.flatten() is err
 
 
 class TestChainCombinators:
     """Tests for and_then and or_else."""
 
-    def test_and_then_on_ok_returns_ok(self) -> None:
-        result = Ok(2).and_then(lambda x: Ok(x * 2))
-        assert result == Ok(4)
-
-    def test_and_then_on_ok_returns_err(self) -> None:
-        result = Ok(2).and_then(lambda x: Err("fail"))
-        assert result == Err("fail")
-
-    def test_and_then_on_err(self) -> None:
-        result: Result[int, str] = Err("error")
-        assert result.and_then(lambda x: Ok(x * 2)) == Err("error")
-
-    def test_or_else_on_ok(self) -> None:
-        result: Result[int, str] = Ok(5)
-        assert result.or_else(lambda e: Ok(0)) == Ok(5)
-
-    def test_or_else_on_err_returns_ok(self) -> None:
-        result: Result[int, str] = Err("error")
-        assert result.or_else(lambda e: Ok(0)) == Ok(0)
-
-    def test_or_else_on_err_returns_err(self) -> None:
-        result: Result[int, str] = Err("error")
-        assert result.or_else(lambda e: Err("new error")) == Err("new error")
+    @pytest.mark.parametrize(("result", "method", "fn", "expected"), _CHAIN_CASES)
+    def test_chain(
+        self, result: Result[int, str], method: str, fn: Callable[[Any], Result[int, str]], expected: object
+    ) -> None:
+        assert getattr(result, method)(fn) == expected
 
 
 class TestAsyncCombinators:
     """Tests for async map, map_err, and_then, or_else."""
 
     async def test_map_async_on_ok(self) -> None:
-        async def async_double(x: int) -> int:
-            return x * 2
-
-        result = await Ok(2).map_async(async_double)
+        result = await Ok(2).map_async(_async_double)
         assert result == Ok(4)
 
     async def test_map_async_on_err(self) -> None:
-        async def async_double(x: int) -> int:
-            return x * 2
-
         result: Result[int, str] = Err("error")
-        assert await result.map_async(async_double) == Err("error")
+        assert await result.map_async(_async_double) == Err("error")
 
     async def test_map_err_async_on_ok(self) -> None:
-        async def async_upper(s: str) -> str:
-            return s.upper()
-
         result: Result[int, str] = Ok(5)
-        assert await result.map_err_async(async_upper) == Ok(5)
+        assert await result.map_err_async(_async_upper) == Ok(5)
 
     async def test_map_err_async_on_err(self) -> None:
-        async def async_upper(s: str) -> str:
-            return s.upper()
-
         result: Result[int, str] = Err("error")
-        assert await result.map_err_async(async_upper) == Err("ERROR")
+        assert await result.map_err_async(_async_upper) == Err("ERROR")
 
     async def test_and_then_async_on_ok(self) -> None:
-        async def async_double_result(x: int) -> Result[int, str]:
-            return Ok(x * 2)
-
-        result = await Ok(2).and_then_async(async_double_result)
+        result = await Ok(2).and_then_async(_async_double_result)
         assert result == Ok(4)
 
     async def test_and_then_async_on_ok_returns_err(self) -> None:
-        async def async_fail(x: int) -> Result[int, str]:
-            return Err("async fail")
-
-        result = await Ok(2).and_then_async(async_fail)
+        result = await Ok(2).and_then_async(_async_fail)
         assert result == Err("async fail")
 
     async def test_and_then_async_on_err(self) -> None:
-        async def async_double_result(x: int) -> Result[int, str]:
-            return Ok(x * 2)
-
         result: Result[int, str] = Err("error")
-        assert await result.and_then_async(async_double_result) == Err("error")
+        assert await result.and_then_async(_async_double_result) == Err("error")
 
     async def test_or_else_async_on_ok(self) -> None:
-        async def async_recover(e: str) -> Result[int, str]:
-            return Ok(0)
-
         result: Result[int, str] = Ok(5)
-        assert await result.or_else_async(async_recover) == Ok(5)
+        assert await result.or_else_async(_async_recover) == Ok(5)
 
     async def test_or_else_async_on_err_returns_ok(self) -> None:
-        async def async_recover(e: str) -> Result[int, str]:
-            return Ok(len(e))
-
         result: Result[int, str] = Err("error")
-        assert await result.or_else_async(async_recover) == Ok(5)
+        assert await result.or_else_async(_async_recover) == Ok(5)
 
     async def test_or_else_async_on_err_returns_err(self) -> None:
-        async def async_fail(e: str) -> Result[int, str]:
-            return Err(f"new: {e}")
-
         result: Result[int, str] = Err("error")
-        assert await result.or_else_async(async_fail) == Err("new: error")
+        assert await result.or_else_async(_async_rewrap) == Err("new: error")
 
 
 class TestPatternMatching:
@@ -337,25 +419,21 @@ class TestPatternMatching:
             case Err(error):
                 assert error == "error"
 
-    def test_match_exhaustive(self) -> None:
-        def process(result: Result[int, str]) -> str:
-            match result:
-                case Ok(value):
-                    return f"success: {value}"
-                case Err(error):
-                    return f"failure: {error}"
-            raise AssertionError("unreachable")
-
-        assert process(Ok(42)) == "success: 42"
-        assert process(Err("oops")) == "failure: oops"
+    @pytest.mark.parametrize(
+        ("result", "expected"),
+        [
+            pytest.param(Ok(42), "success: 42", id="ok"),
+            pytest.param(Err("oops"), "failure: oops", id="err"),
+        ],
+    )
+    def test_match_exhaustive(self, result: Result[int, str], expected: str) -> None:
+        assert _describe(result) == expected
 
 
 class TestEdgeCases:
     """Tests for edge cases and special scenarios."""
 
     def test_ok_with_none_value(self) -> None:
-        from unwrappy import Some
-
         result = Ok(None)
         assert result.is_ok() is True
         assert result.unwrap() is None
@@ -363,8 +441,6 @@ class TestEdgeCases:
         assert repr(result) == "Ok(None)"
 
     def test_err_with_none_error(self) -> None:
-        from unwrappy import Some
-
         result = Err(None)
         assert result.is_err() is True
         assert result.unwrap_err() is None
@@ -386,11 +462,6 @@ class TestEdgeCases:
         assert outer.unwrap().unwrap() == 42
 
     def test_ok_with_complex_object(self) -> None:
-        @dataclass
-        class User:
-            name: str
-            age: int
-
         user = User("Alice", 30)
         result = Ok(user)
 
@@ -404,27 +475,16 @@ class TestEdgeCases:
         assert isinstance(result.unwrap(), int)
 
     def test_chained_operations(self) -> None:
-        def parse_int(s: str) -> Result[int, str]:
-            try:
-                return Ok(int(s))
-            except ValueError:
-                return Err(f"Cannot parse '{s}' as int")
-
-        def validate_positive(n: int) -> Result[int, str]:
-            if n > 0:
-                return Ok(n)
-            return Err("Number must be positive")
-
         # Success chain
-        result = parse_int("42").and_then(validate_positive).map(lambda x: x * 2)
+        result = _parse_int("42").and_then(_validate_positive).map(_double)
         assert result == Ok(84)
 
         # Fail at parse
-        result = parse_int("abc").and_then(validate_positive).map(lambda x: x * 2)
+        result = _parse_int("abc").and_then(_validate_positive).map(_double)
         assert result == Err("Cannot parse 'abc' as int")
 
         # Fail at validate
-        result = parse_int("-5").and_then(validate_positive).map(lambda x: x * 2)
+        result = _parse_int("-5").and_then(_validate_positive).map(_double)
         assert result == Err("Number must be positive")
 
     def test_map_err_then_or_else(self) -> None:
@@ -437,57 +497,42 @@ class TestUnwrapError:
     """Tests for UnwrapError exception."""
 
     def test_unwrap_error_has_value_attribute_on_ok_unwrap_err(self) -> None:
-        try:
+        with pytest.raises(UnwrapError) as exc_info:
             Ok(42).unwrap_err()
-        except UnwrapError as e:
-            assert e.value == 42
+        assert exc_info.value.value == 42
 
     def test_unwrap_error_has_value_attribute_on_err_unwrap(self) -> None:
-        try:
+        with pytest.raises(UnwrapError) as exc_info:
             Err("my error").unwrap()
-        except UnwrapError as e:
-            assert e.value == "my error"
+        assert exc_info.value.value == "my error"
 
     def test_unwrap_error_message_format_expect(self) -> None:
         result: Result[int, str] = Err("detailed error")
-        try:
+        with pytest.raises(UnwrapError, match=r"Operation failed.*detailed error"):
             result.expect("Operation failed")
-        except UnwrapError as e:
-            message = str(e)
-            assert "Operation failed" in message
-            assert "detailed error" in message
 
     def test_unwrap_error_message_format_expect_err(self) -> None:
-        try:
+        with pytest.raises(UnwrapError, match=r"Expected error.*123"):
             Ok(123).expect_err("Expected error")
-        except UnwrapError as e:
-            message = str(e)
-            assert "Expected error" in message
-            assert "123" in message
 
 
 class TestTeeInspect:
     """Tests for tee, inspect, and inspect_err methods."""
 
     def test_tee_on_ok_calls_fn(self) -> None:
-        called_with: list[int] = []
-        Ok(42).tee(lambda x: called_with.append(x))
-        assert called_with == [42]
+        cb = Mock()
+        Ok(42).tee(cb)
+        cb.assert_called_once_with(42)
 
     def test_tee_on_ok_returns_self(self) -> None:
         result = Ok(42)
         assert result.tee(lambda x: None) is result
 
     def test_tee_on_err_skips_fn(self) -> None:
-        called = False
-
-        def should_not_call(x: int) -> None:
-            nonlocal called
-            called = True
-
+        cb = Mock()
         result: Result[int, str] = Err("error")
-        result.tee(should_not_call)
-        assert called is False
+        result.tee(cb)
+        cb.assert_not_called()
 
     def test_tee_on_err_returns_self(self) -> None:
         result: Result[int, str] = Err("error")
@@ -499,24 +544,19 @@ class TestTeeInspect:
         assert Err.inspect is Err.tee
 
     def test_inspect_err_on_err_calls_fn(self) -> None:
-        called_with: list[str] = []
+        cb = Mock()
         result: Result[int, str] = Err("error")
-        result.inspect_err(lambda e: called_with.append(e))
-        assert called_with == ["error"]
+        result.inspect_err(cb)
+        cb.assert_called_once_with("error")
 
     def test_inspect_err_on_err_returns_self(self) -> None:
         result: Result[int, str] = Err("error")
         assert result.inspect_err(lambda e: None) is result
 
     def test_inspect_err_on_ok_skips_fn(self) -> None:
-        called = False
-
-        def should_not_call(e: str) -> None:
-            nonlocal called
-            called = True
-
-        Ok(42).inspect_err(should_not_call)
-        assert called is False
+        cb = Mock()
+        Ok(42).inspect_err(cb)
+        cb.assert_not_called()
 
     def test_inspect_err_on_ok_returns_self(self) -> None:
         result = Ok(42)
@@ -524,12 +564,7 @@ class TestTeeInspect:
 
     def test_tee_chains_nicely(self) -> None:
         log: list[str] = []
-        result = (
-            Ok(5)
-            .tee(lambda x: log.append(f"got {x}"))
-            .map(lambda x: x * 2)
-            .tee(lambda x: log.append(f"doubled to {x}"))
-        )
+        result = Ok(5).tee(lambda x: log.append(f"got {x}")).map(_double).tee(lambda x: log.append(f"doubled to {x}"))
         assert result == Ok(10)
         assert log == ["got 5", "doubled to 10"]
 
@@ -575,6 +610,10 @@ class TestSequenceResults:
         results: list[Result[int, str]] = [Ok(1), Err("first"), Err("second")]
         assert sequence_results(results) == Err("first")
 
+    def test_sequence_results_returns_same_err_instance(self) -> None:
+        err: Result[int, str] = Err("error")
+        assert sequence_results([Ok(1), err, Ok(3)]) is err
+
     def test_sequence_results_empty_list(self) -> None:
         results: list[Result[int, str]] = []
         assert sequence_results(results) == Ok([])
@@ -587,6 +626,14 @@ class TestSequenceResults:
 
         assert sequence_results(gen()) == Ok([1, 2, 3])
 
+    def test_sequence_results_stops_consuming_generator_at_err(self) -> None:
+        def gen() -> Iterable[Result[int, str]]:
+            yield Ok(1)
+            yield Err("e")
+            raise AssertionError("generator consumed past the first Err")
+
+        assert sequence_results(gen()) == Err("e")
+
     def test_traverse_results_all_ok(self) -> None:
         items = [1, 2, 3]
         result = traverse_results(items, lambda x: Ok(x * 2))
@@ -602,6 +649,20 @@ class TestSequenceResults:
 
         assert traverse_results(items, maybe_fail) == Err("failed on 2")
 
+    def test_traverse_results_returns_same_err_instance(self) -> None:
+        err: Result[int, str] = Err("error")
+        assert traverse_results([1, 2], lambda x: err) is err
+
+    def test_traverse_results_stops_calling_fn_after_err(self) -> None:
+        seen: list[int] = []
+
+        def maybe_fail(x: int) -> Result[int, str]:
+            seen.append(x)
+            return Err("stop") if x == 2 else Ok(x)
+
+        assert traverse_results([1, 2, 3, 4], maybe_fail) == Err("stop")
+        assert seen == [1, 2]
+
     def test_traverse_results_empty_list(self) -> None:
         items: list[int] = []
         result = traverse_results(items, lambda x: Ok(x * 2))
@@ -651,199 +712,6 @@ class TestSplit:
         assert err is None
 
 
-class TestResultTypeInference:
-    """Tests for basic Result type inference."""
-
-    def test_ok_type_annotated(self) -> None:
-        ok: Ok[int] = Ok(42)
-        assert_type(ok, Ok[int])
-
-    def test_ok_with_string_annotated(self) -> None:
-        ok: Ok[str] = Ok("hello")
-        assert_type(ok, Ok[str])
-
-    def test_err_type_annotated(self) -> None:
-        err: Err[str] = Err("error")
-        assert_type(err, Err[str])
-
-    def test_err_with_int_annotated(self) -> None:
-        err: Err[int] = Err(404)
-        assert_type(err, Err[int])
-
-    def test_result_union_ok(self) -> None:
-        result: Result[int, str] = Ok(42)
-        # Type checker narrows to Ok[int] but we annotated as Result[int, str]
-        assert_type(result, Ok[int])
-
-    def test_result_union_err(self) -> None:
-        result: Result[int, str] = Err("error")
-        # Type checker narrows to Err[str] but we annotated as Result[int, str]
-        assert_type(result, Err[str])
-
-
-class TestMapTypes:
-    """Tests for type transformations in map operations."""
-
-    def test_map_transforms_ok_type(self) -> None:
-        result: Ok[int] = Ok(42)
-        mapped = result.map(str)
-        assert_type(mapped, Ok[str])
-
-    def test_map_on_ok_directly_annotated(self) -> None:
-        result: Ok[int] = Ok(42)
-        mapped = result.map(str)
-        assert_type(mapped, Ok[str])
-
-    def test_map_err_transforms_err_type(self) -> None:
-        result: Err[str] = Err("error")
-        mapped = result.map_err(len)
-        assert_type(mapped, Err[int])
-
-    def test_map_err_on_err_directly_annotated(self) -> None:
-        result: Err[str] = Err("error")
-        mapped = result.map_err(len)
-        assert_type(mapped, Err[int])
-
-    def test_map_or_return_type(self) -> None:
-        result: Result[int, str] = Ok(42)
-        value = result.map_or("default", str)
-        assert_type(value, str)
-
-    def test_map_or_else_return_type(self) -> None:
-        def error_handler(e: str) -> str:
-            return f"error: {e}"
-
-        result: Result[int, str] = Ok(42)
-        value = result.map_or_else(error_handler, str)
-        assert_type(value, str)
-
-
-class TestChainTypes:
-    """Tests for type transformations in chain operations."""
-
-    def test_and_then_type(self) -> None:
-        def to_string(x: int) -> Ok[str] | Err[str]:
-            return Ok(str(x))
-
-        result: Ok[int] = Ok(42)
-        chained = result.and_then(to_string)
-        assert_type(chained, Ok[str] | Err[str])
-
-    def test_or_else_type(self) -> None:
-        def recover(e: str) -> Ok[int] | Err[int]:
-            return Ok(len(e))
-
-        result: Err[str] = Err("error")
-        recovered = result.or_else(recover)
-        assert_type(recovered, Ok[int] | Err[int])
-
-
-class TestUnwrapTypes:
-    """Tests for unwrap method return types."""
-
-    def test_unwrap_returns_t(self) -> None:
-        result: Result[int, str] = Ok(42)
-        value = result.unwrap()
-        assert_type(value, int)
-
-    def test_unwrap_err_returns_e(self) -> None:
-        result: Result[int, str] = Err("error")
-        error = result.unwrap_err()
-        assert_type(error, str)
-
-    def test_ok_method_returns_some(self) -> None:
-        from unwrappy import Some
-
-        # Ok.ok() now returns Some[T] for type safety
-        result: Ok[int] = Ok(42)
-        value = result.ok()
-        assert_type(value, Some[int])
-
-    def test_err_method_returns_some(self) -> None:
-        from unwrappy import Some
-
-        # Err.err() now returns Some[E] for type safety
-        result: Err[str] = Err("error")
-        error = result.err()
-        assert_type(error, Some[str])
-
-    def test_unwrap_or_returns_t(self) -> None:
-        result: Result[int, str] = Ok(42)
-        value = result.unwrap_or(0)
-        assert_type(value, int)
-
-    def test_unwrap_or_else_returns_t(self) -> None:
-        result: Result[int, str] = Ok(42)
-        value = result.unwrap_or_else(lambda e: 0)
-        assert_type(value, int)
-
-    def test_expect_returns_t(self) -> None:
-        result: Result[int, str] = Ok(42)
-        value = result.expect("should not fail")
-        assert_type(value, int)
-
-    def test_expect_err_returns_e(self) -> None:
-        result: Result[int, str] = Err("error")
-        error = result.expect_err("should not fail")
-        assert_type(error, str)
-
-
-class TestAsyncTypes:
-    """Tests for async method return types.
-
-    Note: These tests verify behavior by awaiting the coroutines,
-    as direct coroutine type assertions have variance issues.
-    """
-
-    async def test_map_async_return_type(self) -> None:
-        async def async_str(x: int) -> str:
-            return str(x)
-
-        result: Ok[int] = Ok(42)
-        awaited = await result.map_async(async_str)
-        assert_type(awaited, Ok[str])
-
-    async def test_map_err_async_return_type(self) -> None:
-        async def async_len(s: str) -> int:
-            return len(s)
-
-        result: Ok[int] = Ok(42)
-        awaited = await result.map_err_async(async_len)
-        assert_type(awaited, Ok[int])
-
-    async def test_and_then_async_return_type(self) -> None:
-        async def async_to_string(x: int) -> Ok[str] | Err[str]:
-            return Ok(str(x))
-
-        result: Ok[int] = Ok(42)
-        awaited = await result.and_then_async(async_to_string)
-        assert_type(awaited, Ok[str] | Err[str])
-
-    async def test_or_else_async_return_type(self) -> None:
-        async def async_recover(e: str) -> Ok[int] | Err[int]:
-            return Ok(len(e))
-
-        result: Err[str] = Err("error")
-        awaited = await result.or_else_async(async_recover)
-        assert_type(awaited, Ok[int] | Err[int])
-
-
-class TestPredicateTypes:
-    """Tests for predicate method return types."""
-
-    def test_is_ok_returns_literal_true(self) -> None:
-        # Ok.is_ok() returns Literal[True] for precise type narrowing
-        result: Ok[int] = Ok(42)
-        is_ok = result.is_ok()
-        assert_type(is_ok, Literal[True])
-
-    def test_is_err_returns_literal_true(self) -> None:
-        # Err.is_err() returns Literal[True] for precise type narrowing
-        result: Err[str] = Err("error")
-        is_err = result.is_err()
-        assert_type(is_err, Literal[True])
-
-
 class TestLazyResultFactory:
     """Tests for LazyResult factory methods."""
 
@@ -864,17 +732,11 @@ class TestLazyResultFactory:
         assert result == Err("error")
 
     async def test_from_awaitable_wraps_coroutine(self) -> None:
-        async def async_ok() -> Result[int, str]:
-            return Ok(42)
-
-        result = await LazyResult.from_awaitable(async_ok()).collect()
+        result = await LazyResult.from_awaitable(_async_ok()).collect()
         assert result == Ok(42)
 
     async def test_from_awaitable_wraps_err_coroutine(self) -> None:
-        async def async_err() -> Result[int, str]:
-            return Err("async error")
-
-        result = await LazyResult.from_awaitable(async_err()).collect()
+        result = await LazyResult.from_awaitable(_async_err()).collect()
         assert result == Err("async error")
 
 
@@ -882,42 +744,37 @@ class TestLazyResultMap:
     """Tests for LazyResult.map()."""
 
     async def test_map_sync_on_ok(self) -> None:
-        result = await LazyResult.ok(5).map(lambda x: x * 2).collect()
+        result = await LazyResult.ok(5).map(_double).collect()
         assert result == Ok(10)
 
     async def test_map_sync_on_err_skips(self) -> None:
-        called = False
+        called = [False]
 
         def should_not_call(x: int) -> int:
-            nonlocal called
-            called = True
+            called[0] = True
             return x * 2
 
         result = await LazyResult.err("error").map(should_not_call).collect()
         assert result == Err("error")
-        assert called is False
+        assert called[0] is False
 
     async def test_map_async_on_ok(self) -> None:
-        async def async_double(x: int) -> int:
-            return x * 2
-
-        result = await LazyResult.ok(5).map(async_double).collect()
+        result = await LazyResult.ok(5).map(_async_double).collect()
         assert result == Ok(10)
 
     async def test_map_async_on_err_skips(self) -> None:
-        called = False
+        called = [False]
 
         async def should_not_call(x: int) -> int:
-            nonlocal called
-            called = True
+            called[0] = True
             return x * 2
 
         result = await LazyResult.err("error").map(should_not_call).collect()
         assert result == Err("error")
-        assert called is False
+        assert called[0] is False
 
     async def test_map_chain_multiple(self) -> None:
-        result = await LazyResult.ok(2).map(lambda x: x + 1).map(lambda x: x * 2).collect()
+        result = await LazyResult.ok(2).map(_inc).map(_double).collect()
         assert result == Ok(6)  # (2 + 1) * 2
 
 
@@ -929,22 +786,18 @@ class TestLazyResultMapErr:
         assert result == Err("ERROR")
 
     async def test_map_err_sync_on_ok_skips(self) -> None:
-        called = False
+        called = [False]
 
         def should_not_call(e: str) -> str:
-            nonlocal called
-            called = True
+            called[0] = True
             return e.upper()
 
         result = await LazyResult.ok(42).map_err(should_not_call).collect()
         assert result == Ok(42)
-        assert called is False
+        assert called[0] is False
 
     async def test_map_err_async_on_err(self) -> None:
-        async def async_upper(e: str) -> str:
-            return e.upper()
-
-        result = await LazyResult.err("error").map_err(async_upper).collect()
+        result = await LazyResult.err("error").map_err(_async_upper).collect()
         assert result == Err("ERROR")
 
 
@@ -960,32 +813,25 @@ class TestLazyResultAndThen:
         assert result == Err("failed")
 
     async def test_and_then_sync_on_err_skips(self) -> None:
-        called = False
+        called = [False]
 
         def should_not_call(x: int) -> Ok[int] | Err[str]:
-            nonlocal called
-            called = True
+            called[0] = True
             return Ok(x * 2)
 
         # Explicitly type the LazyResult to avoid literal type issues
         lazy: LazyResult[int, str] = LazyResult.err("error")
         result = await lazy.and_then(should_not_call).collect()  # ty:ignore[invalid-argument-type]
         assert result == Err("error")
-        assert called is False
+        assert called[0] is False
 
     async def test_and_then_async_on_ok(self) -> None:
-        async def async_double(x: int) -> Result[int, str]:
-            return Ok(x * 2)
-
-        result = await LazyResult.ok(5).and_then(async_double).collect()
+        result = await LazyResult.ok(5).and_then(_async_double_result).collect()
         assert result == Ok(10)
 
     async def test_and_then_async_returns_err(self) -> None:
-        async def async_fail(x: int) -> Result[int, str]:
-            return Err("async failed")
-
-        result = await LazyResult.ok(5).and_then(async_fail).collect()
-        assert result == Err("async failed")
+        result = await LazyResult.ok(5).and_then(_async_fail).collect()
+        assert result == Err("async fail")
 
 
 class TestLazyResultOrElse:
@@ -1000,24 +846,20 @@ class TestLazyResultOrElse:
         assert result == Err("new: error")
 
     async def test_or_else_sync_on_ok_skips(self) -> None:
-        called = False
+        called = [False]
 
         def should_not_call(e: str) -> Ok[int] | Err[str]:
-            nonlocal called
-            called = True
+            called[0] = True
             return Ok(0)
 
         # Explicitly type the LazyResult to avoid literal type issues
         lazy: LazyResult[int, str] = LazyResult.ok(42)
         result = await lazy.or_else(should_not_call).collect()  # ty:ignore[invalid-argument-type]
         assert result == Ok(42)
-        assert called is False
+        assert called[0] is False
 
     async def test_or_else_async_on_err(self) -> None:
-        async def async_recover(e: str) -> Result[int, str]:
-            return Ok(len(e))
-
-        result = await LazyResult.err("error").or_else(async_recover).collect()
+        result = await LazyResult.err("error").or_else(_async_recover).collect()
         assert result == Ok(5)
 
 
@@ -1031,15 +873,14 @@ class TestLazyResultTee:
         assert called_with == [42]
 
     async def test_tee_sync_on_err_skips(self) -> None:
-        called = False
+        called = [False]
 
         def should_not_call(x: int) -> None:
-            nonlocal called
-            called = True
+            called[0] = True
 
         result = await LazyResult.err("error").tee(should_not_call).collect()
         assert result == Err("error")
-        assert called is False
+        assert called[0] is False
 
     async def test_tee_async_on_ok(self) -> None:
         called_with: list[int] = []
@@ -1065,15 +906,14 @@ class TestLazyResultInspectErr:
         assert called_with == ["error"]
 
     async def test_inspect_err_sync_on_ok_skips(self) -> None:
-        called = False
+        called = [False]
 
         def should_not_call(e: str) -> None:
-            nonlocal called
-            called = True
+            called[0] = True
 
         result = await LazyResult.ok(42).inspect_err(should_not_call).collect()
         assert result == Ok(42)
-        assert called is False
+        assert called[0] is False
 
     async def test_inspect_err_async_on_err(self) -> None:
         called_with: list[str] = []
@@ -1102,6 +942,24 @@ class TestLazyResultFlatten:
         result = await lazy.flatten().collect()
         assert result == Err("outer")
 
+    @pytest.mark.parametrize(("value", "expected"), [(2, Ok(5)), (-1, Err("negative"))])
+    async def test_map_then_flatten(self, value: int, expected: Result[int, str]) -> None:
+        result = await (
+            LazyResult.ok(value).map(lambda x: Ok(x * 2) if x > 0 else Err("negative")).flatten().map(_inc).collect()
+        )
+        assert result == expected
+
+    @pytest.mark.parametrize("padding", [0, 20])  # 20 pushes the chain past the compiled-pipeline limit
+    async def test_map_to_plain_value_then_flatten_raises(self, padding: int) -> None:
+        lazy = LazyResult.ok(0)
+        for _ in range(padding):
+            lazy = lazy.map(_inc)
+        to_plain = Mock(return_value=1)
+        tail = Mock()
+        with pytest.raises(TypeError, match="expected Ok to hold a Result, got int"):
+            await lazy.map(to_plain).flatten().map(tail).collect()
+        tail.assert_not_called()
+
 
 class TestLazyResultChaining:
     """Tests for complex chains."""
@@ -1111,7 +969,7 @@ class TestLazyResultChaining:
         result = await (
             LazyResult.ok(5)
             .tee(lambda x: log.append(f"start: {x}"))
-            .map(lambda x: x * 2)
+            .map(_double)
             .tee(lambda x: log.append(f"doubled: {x}"))
             .map(str)
             .tee(lambda x: log.append(f"stringified: {x}"))
@@ -1121,42 +979,26 @@ class TestLazyResultChaining:
         assert log == ["start: 5", "doubled: 10", "stringified: 10"]
 
     async def test_complex_async_chain(self) -> None:
-        async def async_double(x: int) -> int:
-            return x * 2
-
-        async def async_validate(x: int) -> Result[int, str]:
-            if x > 0:
-                return Ok(x)
-            return Err("must be positive")
-
         result = await (
             LazyResult.ok(5)
-            .map(async_double)
-            .and_then(async_validate)  # ty: ignore[invalid-argument-type]
+            .map(_async_double)
+            .and_then(_async_validate_positive)  # ty: ignore[invalid-argument-type]
             .collect()
         )
         assert result == Ok(10)
 
     async def test_mixed_sync_async_chain(self) -> None:
-        async def async_double(x: int) -> int:
-            return x * 2
-
         result = await (
             LazyResult.ok(5)
-            .map(lambda x: x + 1)  # Sync
-            .map(async_double)  # Async
+            .map(_inc)  # Sync
+            .map(_async_double)  # Async
             .map(str)  # Sync
             .collect()
         )
         assert result == Ok("12")  # (5 + 1) * 2 = 12
 
     async def test_short_circuit_on_err(self) -> None:
-        call_count = 0
-
-        def increment(x: int) -> int:
-            nonlocal call_count
-            call_count += 1
-            return x + 1
+        increment = Mock(side_effect=lambda x: x + 1)
 
         result = await (
             LazyResult.ok(5)
@@ -1167,7 +1009,47 @@ class TestLazyResultChaining:
             .collect()
         )
         assert result == Err("fail")
-        assert call_count == 1
+        assert increment.call_count == 1
+
+    async def test_err_skips_run_of_ok_ops(self) -> None:
+        on_ok = Mock(side_effect=lambda x: x)
+        on_err = Mock()
+        result = await (
+            LazyResult.err("e")
+            .map(on_ok)
+            .tee(on_ok)
+            .map(on_ok)
+            .map_err(str.upper)
+            .inspect_err(on_err)
+            .or_else(lambda e: Ok(len(e)))
+            .map(on_ok)
+            .collect()
+        )
+        assert result == Ok(1)
+        on_ok.assert_called_once_with(1)
+        on_err.assert_called_once_with("E")
+
+    async def test_consecutive_maps_mixing_sync_and_async(self) -> None:
+        result = await (
+            LazyResult.ok(1)
+            .map(_inc)
+            .map(_async_double)
+            .map(_double)  # ty: ignore[invalid-argument-type]
+            .tee(lambda x: None)
+            .map(_inc)
+            .collect()
+        )
+        assert result == Ok(9)
+
+    async def test_consecutive_map_errs_mixing_sync_and_async(self) -> None:
+        result = await (
+            LazyResult.err("e")
+            .map_err(str.strip)
+            .map_err(_async_upper)
+            .map_err(len)  # ty: ignore[invalid-argument-type]
+            .collect()
+        )
+        assert result == Err(1)
 
     async def test_recovery_with_or_else(self) -> None:
         result = await (
@@ -1175,7 +1057,7 @@ class TestLazyResultChaining:
             .and_then(lambda x: Err("failed"))  # Fails
             .map(lambda x: x * 100)  # Skipped
             .or_else(lambda e: Ok(0))  # Recovers
-            .map(lambda x: x + 1)  # Runs on recovered value
+            .map(_inc)  # Runs on recovered value
             .collect()
         )
         assert result == Ok(1)
@@ -1189,29 +1071,76 @@ class TestLazyResultChaining:
         )
         assert result == Ok(42)
 
+    async def test_sync_fn_returning_coroutine(self) -> None:
+        def sync_wrapper(x: int) -> Coroutine[Any, Any, int]:
+            return _async_double(x)
+
+        result = await LazyResult.ok(5).map(sync_wrapper).collect()
+        assert result == Ok(10)
+
+    def test_sync_chain_completes_without_suspending(self) -> None:
+        coro = LazyResult.ok(2).map(_double).and_then(Ok).tee(Mock()).collect()
+        with pytest.raises(StopIteration) as exc_info:
+            coro.send(None)
+        assert exc_info.value.value == Ok(4)
+
+    async def test_async_callables_of_every_kind(self) -> None:
+        result = await (
+            LazyResult.ok(5)
+            .map(Doubler().double)  # bound async method
+            .map(partial(_async_double))  # not classified, awaited via isawaitable
+            .map(MethodType(AsyncScale(), 2))  # method bound from a callable object
+            .and_then(_async_double_result)
+            .collect()
+        )
+        assert result == Ok(80)
+
+    async def test_same_shape_chains_use_their_own_fns(self) -> None:
+        first = await LazyResult.ok(1).map(_inc).and_then(lambda x: Ok(x * 10)).collect()
+        second = await LazyResult.ok(1).map(lambda x: x - 1).and_then(Err).collect()
+        assert first == Ok(20)
+        assert second == Err(0)
+
+    async def test_long_chain_beyond_compiled_limit(self) -> None:
+        lazy = LazyResult.ok(0)
+        for _ in range(40):
+            lazy = lazy.map(_inc)
+        assert await lazy.collect() == Ok(40)
+
+    async def test_long_chain_runs_every_op_kind(self) -> None:
+        seen: list[int] = []
+        lazy = LazyResult.ok(1)
+        for _ in range(4):  # 36 ops, past the compiled-pipeline limit
+            lazy = (
+                lazy.map(_inc)
+                .map(_async_double)
+                .tee(seen.append)  # ty: ignore[invalid-argument-type]
+                .and_then(Err)
+                .map(lambda x: x * 100)  # Skipped
+                .inspect_err(seen.append)
+                .map_err(lambda e: e - 1)
+                .or_else(lambda e: Ok(Ok(e)))
+                .flatten()
+            )
+        assert await lazy.collect() == Ok(31)
+        assert seen == [4, 4, 8, 8, 16, 16, 32, 32]
+
 
 class TestLazyResultFromAwaitable:
     """Tests for LazyResult.from_awaitable()."""
 
     async def test_from_async_function_ok(self) -> None:
-        async def fetch_data() -> Result[int, str]:
-            return Ok(42)
-
-        result = await LazyResult.from_awaitable(fetch_data()).collect()
+        result = await LazyResult.from_awaitable(_async_ok()).collect()
         assert result == Ok(42)
 
     async def test_from_async_function_err(self) -> None:
-        async def fetch_data() -> Result[int, str]:
-            return Err("network error")
-
-        result = await LazyResult.from_awaitable(fetch_data()).collect()
-        assert result == Err("network error")
+        result = await LazyResult.from_awaitable(_async_err()).collect()
+        assert result == Err("async error")
 
     async def test_chain_from_awaitable(self) -> None:
-        async def fetch_user(id: int) -> Result[dict[str, str], str]:
-            return Ok({"name": "Alice", "id": str(id)})
-
-        result = await LazyResult.from_awaitable(fetch_user(42)).map(lambda u: u["name"]).map(str.upper).collect()
+        result = (
+            await LazyResult.from_awaitable(_async_fetch_user(42)).map(lambda u: u["name"]).map(str.upper).collect()
+        )
         assert result == Ok("ALICE")
 
 
@@ -1231,14 +1160,12 @@ class TestResultLazyMethod:
         assert result == Err("error")
 
     async def test_lazy_chain_and_collect(self) -> None:
-        result = await Ok(5).lazy().map(lambda x: x * 2).map(str).collect()
+        result = await Ok(5).lazy().map(_double).map(str).collect()
         assert result == Ok("10")
 
     async def test_lazy_from_result_chain(self) -> None:
         initial: Result[int, str] = Ok(10)
-        result = await (
-            initial.lazy().and_then(lambda x: Ok(x + 5) if x > 0 else Err("negative")).map(lambda x: x * 2).collect()
-        )
+        result = await initial.lazy().and_then(lambda x: Ok(x + 5) if x > 0 else Err("negative")).map(_double).collect()
         assert result == Ok(30)  # (10 + 5) * 2
 
 
@@ -1247,8 +1174,8 @@ class TestLazyResultImmutability:
 
     async def test_chain_creates_new_instance(self) -> None:
         lazy1 = LazyResult.ok(5)
-        lazy2 = lazy1.map(lambda x: x * 2)
-        lazy3 = lazy1.map(lambda x: x + 1)
+        lazy2 = lazy1.map(_double)
+        lazy3 = lazy1.map(_inc)
 
         # All are different instances
         assert lazy1 is not lazy2
@@ -1265,10 +1192,10 @@ class TestLazyResultImmutability:
         assert r3 == Ok(6)
 
     async def test_reuse_lazy_base(self) -> None:
-        base = LazyResult.ok(5).map(lambda x: x * 2)
+        base = LazyResult.ok(5).map(_double)
 
         # Create two branches from the same base
-        branch1 = base.map(lambda x: x + 1)
+        branch1 = base.map(_inc)
         branch2 = base.map(lambda x: x - 1)
 
         r1 = await branch1.collect()
@@ -1278,112 +1205,14 @@ class TestLazyResultImmutability:
         assert r2 == Ok(9)  # 5 * 2 - 1
 
 
-class TestLazyResultTypes:
-    """Type inference tests for LazyResult chain methods."""
-
-    # Factory methods
-    # Note: ty has known limitations with generic TypeVar inference (astral-sh/ty#501)
-    # These assert_type tests document expected types but ty infers Unknown instead
-    async def test_ok_type(self) -> None:
-        lazy = LazyResult.ok(42)
-        result = await lazy.collect()
-        assert_type(result, Result[int, Any])  # ty: ignore[type-assertion-failure]
-
-    async def test_err_type(self) -> None:
-        lazy = LazyResult.err("error")
-        result = await lazy.collect()
-        assert_type(result, Result[Any, str])  # ty: ignore[type-assertion-failure]
-
-    async def test_from_result_type(self) -> None:
-        lazy = LazyResult.from_result(Ok(42))
-        assert_type(lazy, LazyResult[int, Any])  # ty: ignore[type-assertion-failure]
-
-    # map - transforms T to U, preserves E
-    async def test_map_type(self) -> None:
-        lazy: LazyResult[int, str] = LazyResult.from_result(Ok(42))
-        mapped = lazy.map(str)
-        assert_type(mapped, LazyResult[str, str])  # ty: ignore[type-assertion-failure]
-
-    async def test_map_chain_type(self) -> None:
-        lazy: LazyResult[int, str] = LazyResult.from_result(Ok(42))
-        chained = lazy.map(str).map(len)
-        assert_type(chained, LazyResult[int, str])  # ty: ignore[type-assertion-failure]
-
-    # map_err - transforms E to F, preserves T
-    async def test_map_err_type(self) -> None:
-        lazy: LazyResult[int, str] = LazyResult.from_result(Err("error"))
-        mapped = lazy.map_err(len)
-        assert_type(mapped, LazyResult[int, int])  # ty: ignore[type-assertion-failure]
-
-    # and_then - transforms T to U via Result[U, E]
-    async def test_and_then_type(self) -> None:
-        def to_string(x: int) -> Result[str, str]:
-            return Ok(str(x))
-
-        lazy: LazyResult[int, str] = LazyResult.from_result(Ok(42))
-        chained = lazy.and_then(to_string)
-        assert_type(chained, LazyResult[str, str])  # ty: ignore[type-assertion-failure]
-
-    # or_else - transforms E to F via Result[T, F]
-    async def test_or_else_type(self) -> None:
-        def recover(e: str) -> Result[int, int]:
-            return Ok(len(e))
-
-        lazy: LazyResult[int, str] = LazyResult.from_result(Err("error"))
-        recovered = lazy.or_else(recover)
-        assert_type(recovered, LazyResult[int, int])  # ty: ignore[type-assertion-failure]
-
-    # tee - preserves T and E (side effect only)
-    async def test_tee_type(self) -> None:
-        lazy: LazyResult[int, str] = LazyResult.from_result(Ok(42))
-        teed = lazy.tee(print)
-        assert_type(teed, LazyResult[int, str])  # ty: ignore[type-assertion-failure]
-
-    # inspect (alias for tee)
-    async def test_inspect_type(self) -> None:
-        lazy: LazyResult[int, str] = LazyResult.from_result(Ok(42))
-        inspected = lazy.inspect(print)
-        assert_type(inspected, LazyResult[int, str])  # ty: ignore[type-assertion-failure]
-
-    # inspect_err - preserves T and E (side effect only)
-    async def test_inspect_err_type(self) -> None:
-        lazy: LazyResult[int, str] = LazyResult.from_result(Err("error"))
-        inspected = lazy.inspect_err(print)
-        assert_type(inspected, LazyResult[int, str])  # ty: ignore[type-assertion-failure]
-
-    # flatten - Result[Result[U, E], E] -> Result[U, E]
-    async def test_flatten_type(self) -> None:
-        inner: Result[int, str] = Ok(42)
-        lazy: LazyResult[Result[int, str], str] = LazyResult.from_result(Ok(inner))
-        flattened = lazy.flatten()
-        assert_type(flattened, LazyResult[int, str])  # ty: ignore[type-assertion-failure]
-
-    # collect - LazyResult[T, E] -> Result[T, E]
-    async def test_collect_type(self) -> None:
-        lazy: LazyResult[int, str] = LazyResult.from_result(Ok(42))
-        result = await lazy.collect()
-        assert_type(result, Result[int, str])  # ty: ignore[type-assertion-failure]
-
-    # Complex chain preserves final types
-    async def test_complex_chain_type(self) -> None:
-        def validate(x: int) -> Result[str, str]:
-            return Ok(str(x)) if x > 0 else Err("negative")
-
-        lazy: LazyResult[int, str] = LazyResult.from_result(Ok(42))
-        chained = lazy.map(lambda x: x * 2).and_then(validate).map(len)
-        assert_type(chained, LazyResult[int, str])  # ty: ignore[type-assertion-failure]
-
-
 class TestContext:
     """Tests for context() and with_context() error chaining."""
 
     def test_context_on_ok_returns_self(self) -> None:
-        result = Ok(42).context("some context")
-        assert result == Ok(42)
+        ok = Ok(42)
+        assert ok.context("some context") is ok
 
     def test_context_on_err_wraps_error(self) -> None:
-        from unwrappy import ChainedError
-
         result = Err("original error").context("parsing config")
         assert result.is_err()
         error = result.unwrap_err()
@@ -1391,28 +1220,19 @@ class TestContext:
         assert str(error) == "parsing config: original error"
 
     def test_context_chaining(self) -> None:
-        from unwrappy import ChainedError
-
         result = Err("invalid json").context("parsing config").context("loading settings")
         error = result.unwrap_err()
         assert isinstance(error, ChainedError)
         assert str(error) == "loading settings: parsing config: invalid json"
 
     def test_with_context_on_ok_skips_fn(self) -> None:
-        called = False
+        lazy_context = Mock(return_value="context")
 
-        def lazy_context() -> str:
-            nonlocal called
-            called = True
-            return "context"
-
-        result = Ok(42).with_context(lazy_context)
-        assert result == Ok(42)
-        assert called is False  # Function not called for Ok
+        ok = Ok(42)
+        assert ok.with_context(lazy_context) is ok
+        lazy_context.assert_not_called()  # Function not called for Ok
 
     def test_with_context_on_err_calls_fn(self) -> None:
-        from unwrappy import ChainedError
-
         user_id = 123
         result = Err("not found").with_context(lambda: f"fetching user {user_id}")
         error = result.unwrap_err()
@@ -1420,21 +1240,36 @@ class TestContext:
         assert str(error) == "fetching user 123: not found"
 
     def test_chained_error_root_cause(self) -> None:
-        from unwrappy import ChainedError
-
         result = Err("root").context("level1").context("level2")
         error = result.unwrap_err()
         assert isinstance(error, ChainedError)
         assert error.root_cause() == "root"
 
     def test_chained_error_chain(self) -> None:
-        from unwrappy import ChainedError
-
         result = Err("root").context("level1").context("level2")
         error = result.unwrap_err()
         assert isinstance(error, ChainedError)
         assert error.chain() == ["level2", "level1"]
 
+    def test_deep_chain_beyond_recursion_limit(self) -> None:
+        result: Result[Any, Any] = Err("root")
+        for i in range(3000):
+            result = result.context(f"l{i}")
+        error = result.unwrap_err()
+        assert isinstance(error, ChainedError)
+        assert error.root_cause() == "root"
+        assert len(error.chain()) == 3000
+        assert str(error).startswith("l2999: l2998: ")
+        assert str(error).endswith("l0: root")
+
+    def test_reassigned_error_is_reflected_everywhere(self) -> None:
+        error = ChainedError(ChainedError("old root", "inner"), "outer")
+        error.error = ChainedError("new root", "replaced")
+        assert error.root_cause() == "new root"
+        assert error.chain() == ["outer", "replaced"]
+        assert str(error) == "outer: replaced: new root"
+        assert error == ChainedError(ChainedError("new root", "replaced"), "outer")
+
 
 class TestFilter:
     """Tests for filter() method on Result."""
@@ -1449,8 +1284,7 @@ class TestFilter:
 
     def test_filter_err_unchanged(self) -> None:
         result: Result[int, str] = Err("original error")
-        filtered = result.filter(lambda x: x > 0, "validation failed")
-        assert filtered == Err("original error")
+        assert result.filter(lambda x: x > 0, "validation failed") is result
 
     def test_filter_with_complex_predicate(self) -> None:
         def is_valid_email(s: str) -> bool:
@@ -1466,36 +1300,28 @@ class TestFilter:
 class TestZip:
     """Tests for zip() and zip_with() methods on Result."""
 
-    def test_zip_ok_ok(self) -> None:
-        result = Ok(1).zip(Ok("a"))
-        assert result == Ok((1, "a"))
-
-    def test_zip_ok_err(self) -> None:
-        result = Ok(1).zip(Err("error"))
-        assert result == Err("error")
-
-    def test_zip_err_ok(self) -> None:
-        result: Result[int, str] = Err("first error")
-        zipped = result.zip(Ok(2))
-        assert zipped == Err("first error")
-
-    def test_zip_err_err(self) -> None:
-        result: Result[int, str] = Err("first")
-        zipped = result.zip(Err("second"))
-        assert zipped == Err("first")  # First error wins
-
-    def test_zip_with_ok_ok(self) -> None:
-        result = Ok(2).zip_with(Ok(3), lambda a, b: a + b)
-        assert result == Ok(5)
-
-    def test_zip_with_ok_err(self) -> None:
-        result = Ok(2).zip_with(Err("error"), lambda a, b: a + b)
-        assert result == Err("error")
-
-    def test_zip_with_err_ok(self) -> None:
-        result: Result[int, str] = Err("error")
-        zipped = result.zip_with(Ok(3), lambda a, b: a + b)
-        assert zipped == Err("error")
+    @pytest.mark.parametrize(
+        ("result", "method", "args", "expected"),
+        [
+            pytest.param(Ok(1), "zip", (Ok("a"),), Ok((1, "a")), id="zip_ok_ok"),
+            pytest.param(Ok(1), "zip", (Err("error"),), Err("error"), id="zip_ok_err"),
+            pytest.param(Err("first error"), "zip", (Ok(2),), Err("first error"), id="zip_err_ok"),
+            pytest.param(Err("first"), "zip", (Err("second"),), Err("first"), id="zip_err_err"),  # First error wins
+            pytest.param(Ok(2), "zip_with", (Ok(3), add), Ok(5), id="zip_with_ok_ok"),
+            pytest.param(Ok(2), "zip_with", (Err("error"), add), Err("error"), id="zip_with_ok_err"),
+            pytest.param(Err("error"), "zip_with", (Ok(3), add), Err("error"), id="zip_with_err_ok"),
+        ],
+    )
+    def test_zip(self, result: Result[Any, Any], method: str, args: tuple[Any, ...], expected: object) -> None:
+        assert getattr(result, method)(*args) == expected
+
+    def test_zip_passthrough_returns_same_instance(self) -> None:
+        ok: Result[int, str] = Ok(1)
+        err: Result[int, str] = Err("error")
+        assert ok.zip(err) is err
+        assert ok.zip_with(err, add) is err
+        assert err.zip(ok) is err
+        assert err.zip_with(ok, add) is err
 
     def test_zip_multiple(self) -> None:
         """Test chaining multiple zips."""
@@ -1510,21 +1336,17 @@ class TestZip:
 class TestTypeGuardFunctions:
     """Tests for is_ok and is_err type guard functions."""
 
-    def test_is_ok_on_ok(self) -> None:
-        result: Result[int, str] = Ok(42)
-        assert is_ok(result) is True
-
-    def test_is_ok_on_err(self) -> None:
-        result: Result[int, str] = Err("error")
-        assert is_ok(result) is False
-
-    def test_is_err_on_err(self) -> None:
-        result: Result[int, str] = Err("error")
-        assert is_err(result) is True
-
-    def test_is_err_on_ok(self) -> None:
-        result: Result[int, str] = Ok(42)
-        assert is_err(result) is False
+    @pytest.mark.parametrize(
+        ("guard", "result", "expected"),
+        [
+            pytest.param(is_ok, Ok(42), True, id="is_ok_on_ok"),
+            pytest.param(is_ok, Err("error"), False, id="is_ok_on_err"),
+            pytest.param(is_err, Err("error"), True, id="is_err_on_err"),
+            pytest.param(is_err, Ok(42), False, id="is_err_on_ok"),
+        ],
+    )
+    def test_guard(self, guard: Callable[[Result[Any, Any]], bool], result: Result[Any, Any], expected: bool) -> None:
+        assert guard(result) is expected
 
     def test_is_ok_type_narrowing(self) -> None:
         """Test that is_ok narrows the type to Ok."""
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import io
 import json
+import math
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
 
 import pytest
 
@@ -10,8 +15,13 @@ from unwrappy import NOTHING, Err, LazyOption, LazyResult, Ok, Option, Result, S
 from unwrappy.serde import (
     ResultDecoder,
     ResultEncoder,
+    dump,
     dumps,
+    dumps_bytes,
+    dumps_fast,
+    load,
     loads,
+    loads_fast,
     result_decoder,
 )
 
@@ -75,16 +85,13 @@ class TestResultEncoder:
 
     def test_encode_lazy_result_raises(self) -> None:
         lazy = LazyResult.ok(42)
-        with pytest.raises(TypeError) as exc_info:
+        with pytest.raises(TypeError, match=r"LazyResult.*collect\(\)"):
             json.dumps(lazy, cls=ResultEncoder)
-        assert "LazyResult" in str(exc_info.value)
-        assert "collect()" in str(exc_info.value)
 
     def test_encode_lazy_result_with_ops_raises(self) -> None:
         lazy = LazyResult.ok(42).map(lambda x: x * 2)
-        with pytest.raises(TypeError) as exc_info:
+        with pytest.raises(TypeError, match="LazyResult"):
             json.dumps(lazy, cls=ResultEncoder)
-        assert "LazyResult" in str(exc_info.value)
 
     def test_encode_nested_result_ok_ok(self) -> None:
         nested: Result[Result[int, str], str] = Ok(Ok(42))
@@ -116,6 +123,10 @@ class TestResultEncoder:
         assert decoded["success"]["__unwrappy_type__"] == "Ok"
         assert decoded["failure"]["__unwrappy_type__"] == "Err"
 
+    def test_encode_unsupported_type_raises(self) -> None:
+        with pytest.raises(TypeError, match="not JSON serializable"):
+            json.dumps({"value": object()}, cls=ResultEncoder)
+
 
 class TestResultDecoder:
     """Tests for result_decoder and ResultDecoder."""
@@ -248,6 +259,21 @@ class TestConvenienceFunctions:
         decoded = loads(encoded)
         assert decoded == original
 
+    @pytest.mark.parametrize(
+        "result",
+        [Ok(42), Ok(-(10**30)), Ok(True), Ok(None), Err("not found"), Err('caf\u00e9 "quoted"\n'), Ok(1.5), Ok([1])],
+    )
+    def test_dumps_matches_encoder(self, result: Result[Any, Any]) -> None:
+        assert dumps(result) == json.dumps(result, cls=ResultEncoder)
+
+    def test_dump_load_roundtrip(self) -> None:
+        original = Ok({"items": [Some(1), NOTHING, Err("x")]})
+        buffer = io.StringIO()
+        dump(original, buffer)
+        assert buffer.getvalue() == dumps(original)
+        buffer.seek(0)
+        assert load(buffer) == original
+
     def test_dumps_with_indent(self) -> None:
         result = dumps(Ok(42), indent=2)
         assert "\n" in result
@@ -257,6 +283,94 @@ class TestConvenienceFunctions:
         assert result.index('"a"') < result.index('"b"')
 
 
+class TestFastFunctions:
+    """Tests for dumps_fast() and loads_fast()."""
+
+    def test_dumps_fast_ok(self) -> None:
+        assert dumps_fast(Ok(42)) == '{"__unwrappy_type__":"Ok","value":42}'
+
+    def test_dumps_fast_err(self) -> None:
+        assert dumps_fast(Err("error")) == '{"__unwrappy_type__":"Err","error":"error"}'
+
+    def test_dumps_fast_nothing(self) -> None:
+        assert dumps_fast(NOTHING) == '{"__unwrappy_type__":"Nothing"}'
+
+    def test_dumps_fast_matches_dumps(self) -> None:
+        original = {"items": [Ok(1), Err("x"), Some((1, 2)), NOTHING], "nested": Ok(Some(Err(None)))}
+        assert json.loads(dumps_fast(original)) == json.loads(dumps(original))
+
+    def test_dumps_bytes_matches_dumps_fast(self) -> None:
+        original = {"name": "caf\u00e9", "items": [Ok(1), Err("x"), Some(None), NOTHING]}
+        assert dumps_bytes(original) == dumps_fast(original).encode()
+
+    def test_dumps_fast_lazy_result_raises(self) -> None:
+        with pytest.raises(TypeError, match="LazyResult"):
+            dumps_fast([LazyResult.ok(42)])
+
+    def test_dumps_fast_unsupported_type_raises(self) -> None:
+        with pytest.raises(TypeError, match="not JSON serializable"):
+            dumps_fast(Ok(object()))
+
+    def test_dumps_fast_result_inside_tuple_and_dict_subclass(self) -> None:
+        assert json.loads(dumps_fast(OrderedDict(pair=(Ok(1), NOTHING)))) == json.loads(
+            dumps({"pair": [Ok(1), NOTHING]})
+        )
+
+    def test_dumps_fast_rejects_int_beyond_64_bits(self) -> None:
+        pytest.importorskip("orjson")
+        assert loads(dumps(Ok(2**70))) == Ok(2**70)
+        with pytest.raises(TypeError, match="64-bit"):
+            dumps_fast(Ok(2**70))
+
+    def test_dumps_fast_writes_nan_as_null(self) -> None:
+        pytest.importorskip("orjson")
+        assert dumps(Ok(float("nan"))) == '{"__unwrappy_type__": "Ok", "value": NaN}'
+        assert dumps_fast(Ok(float("nan"))) == '{"__unwrappy_type__":"Ok","value":null}'
+
+    def test_loads_fast_rejects_nan_literal(self) -> None:
+        pytest.importorskip("orjson")
+        document = '{"__unwrappy_type__": "Ok", "value": NaN}'
+        assert math.isnan(loads(document).unwrap())
+        with pytest.raises(ValueError):
+            loads_fast(document)
+
+    def test_dumps_fast_rejects_deep_nesting(self) -> None:
+        pytest.importorskip("orjson")
+        nested: Any = Ok(0)
+        for _ in range(300):
+            nested = [nested]
+        assert loads(dumps(nested)) == nested
+        with pytest.raises(TypeError, match="Recursion limit"):
+            dumps_fast(nested)
+
+    def test_loads_fast_rejects_deep_nesting(self) -> None:
+        pytest.importorskip("orjson")
+        with pytest.raises(ValueError):
+            loads_fast("[" * 1100 + "]" * 1100)
+
+    def test_loads_fast_ok(self) -> None:
+        assert loads_fast('{"__unwrappy_type__": "Ok", "value": 42}') == Ok(42)
+
+    def test_loads_fast_bytes(self) -> None:
+        assert loads_fast(b'{"__unwrappy_type__": "Err", "error": "x"}') == Err("x")
+
+    def test_loads_fast_regular_dict_unchanged(self) -> None:
+        assert loads_fast('{"name": "test", "value": 123}') == {"name": "test", "value": 123}
+
+    def test_loads_fast_deeply_nested(self) -> None:
+        depth = 400
+        document = '{"__unwrappy_type__":"Ok","value":[' * depth + "0" + "]}" * depth
+        result = loads_fast(document)
+        for _ in range(depth):
+            assert type(result) is Ok
+            result = result.unwrap()[0]
+        assert result == 0
+
+    def test_roundtrip_fast_nested(self) -> None:
+        original = [Ok({"user": Some("alice"), "tags": [Err("x"), NOTHING]}), Ok(Ok(42))]
+        assert loads_fast(dumps_fast(original)) == original
+
+
 class TestEdgeCases:
     """Edge case tests for JSON serialization."""
 
@@ -342,16 +456,21 @@ class TestOptionEncoder:
         data = json.loads(result)
         assert data["value"] == [1, 2, 3]
 
+    @pytest.mark.parametrize("encode", [dumps, dumps_fast])
+    def test_encode_some_subclass(self, encode: Callable[[Any], str]) -> None:
+        class Tagged(Some[int]):
+            pass
+
+        assert json.loads(encode([Tagged(1)])) == [{"__unwrappy_type__": "Some", "value": 1}]
+
     def test_encode_nothing(self) -> None:
         result = json.dumps(NOTHING, cls=ResultEncoder)
         assert json.loads(result) == {"__unwrappy_type__": "Nothing"}
 
     def test_encode_lazy_option_raises(self) -> None:
         lazy = LazyOption.some(42)
-        with pytest.raises(TypeError) as exc_info:
+        with pytest.raises(TypeError, match=r"LazyOption.*collect\(\)"):
             json.dumps(lazy, cls=ResultEncoder)
-        assert "LazyOption" in str(exc_info.value)
-        assert "collect()" in str(exc_info.value)
 
     def test_encode_nested_option(self) -> None:
         nested: Option[Option[int]] = Some(Some(42))